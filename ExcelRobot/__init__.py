@@ -3,6 +3,9 @@
 import logging
 import six
 from ExcelRobot.base import ExcelLibrary
+from ExcelRobot.cache import SHEET_RESIDENCY, WORKBOOK_CACHE
+from ExcelRobot.listener import ExcelMetricsListener
+from ExcelRobot.metrics import METRICS
 from ExcelRobot.utils import DateFormat, NumberFormat, BoolFormat
 
 
@@ -34,6 +37,26 @@ class ExcelRobot(ExcelLibrary):
         *Excel Boolean format*
         | Boolean Format        | Default: `Yes/No`  |
 
+    Parsed workbooks are cached per process and reused by `Open Excel` and `Open Excel To Write` as long as the file
+    is unchanged on disk (same path, size and modification time). The cache is bounded by the total size of the cached
+    files and evicts the least recently used workbook first.
+
+        *Workbook cache*
+        | Workbook Cache Size   | Default: `256` (MB). `0` disables the cache  |
+
+    Sheets of `xls` workbooks are parsed on first access. To bound the memory of workbooks with many sheets, the least
+    recently used sheets are unloaded once one of these limits is reached, and parsed again on next access.
+
+        *Sheet residency*
+        | Max Resident Sheets       | Default: `0` (no limit)       |
+        | Max Resident Sheet Size   | Default: `0` (MB, no limit)   |
+
+    Metrics of the library keywords and of parsing, conversion and saving are collected when `Metrics` is `True`, and
+    returned by `Get Excel Metrics` with a summary per suite. Metrics are disabled by default and then cost nothing.
+
+        *Metrics*
+        | Metrics                   | Default: `False`              |
+
     Example:
         | Library | ExcelRobot | date_format='dd/mm/yyyy'
     """
@@ -41,11 +64,17 @@ class ExcelRobot(ExcelLibrary):
 
     def __init__(self,
                  date_format='yyyy-mm-dd', time_format='HH:MM:SS AM/PM', datetime_format='yyyy-mm-dd HH:MM',
-                 decimal_sep='.', thousand_sep=',', precision='2', bool_format='Yes/No'):
+                 decimal_sep='.', thousand_sep=',', precision='2', bool_format='Yes/No',
+                 workbook_cache_size='256', max_resident_sheets='0', max_resident_sheet_size='0', metrics=False):
         logging.basicConfig()
         logging.getLogger().setLevel(logging.INFO)
         logger = logging.getLogger(__name__)
         logger.info('ExcelRobot::Robotframework Excel Library')
+        WORKBOOK_CACHE.resize(int(workbook_cache_size) * 1024 * 1024)
+        SHEET_RESIDENCY.resize(int(max_resident_sheets), int(max_resident_sheet_size) * 1024 * 1024)
+        if str(metrics).lower() not in ('false', 'no', 'off', '0', 'none', ''):
+            METRICS.enabled = True
+            self.ROBOT_LIBRARY_LISTENER = ExcelMetricsListener(library=self.__class__.__name__)
         super(ExcelRobot, self).__init__(
             DateFormat(date_format, time_format, datetime_format),
             NumberFormat(decimal_sep, thousand_sep, precision),
@@ -1,6 +1,16 @@
-from ExcelRobot.reader import ExcelReader
+from collections import OrderedDict
+
+from ExcelRobot.cache import SHEET_RESIDENCY
+from ExcelRobot.metrics import METRICS
+from ExcelRobot.parallel import find_files, map_in_processes, read_workbook_values
+from ExcelRobot.reader import DEFAULT_MODE, ExcelReader
+from ExcelRobot.registry import ExcelRegistry
 from ExcelRobot.utils import BoolFormat, DateFormat, NumberFormat
-from ExcelRobot.writer import ExcelWriter
+from ExcelRobot.writer import ExcelWriter, ValueConverter, import_csv
+
+
+DEFAULT_READ_ALIAS = 'read'
+DEFAULT_WRITE_ALIAS = 'write'
 
 
 class ExcelLibrary(object):
@@ -17,37 +27,150 @@ class ExcelLibrary(object):
         self.bool_format = bool_format
         self.reader = None
         self.writer = None
+        self._excels = ExcelRegistry()
 
-    def open_excel(self, file_path):
+    def open_excel(self, file_path, mode='default', alias=None, use_mmap=True):
         """
         Opens the Excel file to read from the path provided in the file path parameter.
 
+        With `Mode` is `streaming`, `xlsx` file is read row by row with bounded memory instead of being loaded
+        entirely. Keywords that read rows, columns or whole sheets keep working, but keywords that need random cell
+        access, such as `Read Cell Data` or `Check Cell Type`, fail in this mode.
+
+        `xls` file is memory-mapped: sheets are parsed on demand from the page cache of the operating system instead of
+        a copy of the file in memory, and the pages are shared by the processes reading the same file, as the workers
+        of `Get Workbook Values`. With `Use Mmap` is `False`, the file is read in memory instead. It applies when the
+        file is parsed, not to a workbook served from the workbook cache.
+
         Arguments:
-                |  File Path (string) | The Excel file name or path will be opened. If file name then openning file in current directory.   |
+                |  File Path (string)               | The Excel file name or path will be opened. If file name then openning file in current directory.   |
+                |  Mode (Default: `default`)        | Available options: `default`, `streaming` (only `xlsx`)                                               |
+                |  Alias (Default: `read`)          | The alias to switch back to this file with `Switch Excel`.                                            |
+                |  Use Mmap (Default: `True`)       | If `False`, `xls` file is read in memory instead of being memory-mapped.                              |
         Example:
 
-        | *Keywords*           |  *Parameters*                                      |
-        | Open Excel           |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
+        | *Keywords*           |  *Parameters*                                      |           |
+        | Open Excel           |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |           |
+        | Open Excel           |  C:\\Python27\\ExcelRobotTest\\Export.xlsx         | streaming |
+
+        """
+        self.reader = ExcelReader(file_path, self.date_format, self.number_format, self.bool_format, mode,
+                                  use_mmap=use_mmap)
+        return self._excels.register(self.reader, alias or DEFAULT_READ_ALIAS)
+
+    def open_excel_from_bytes(self, content, mode='default', alias=None):
+        """
+        Opens the Excel workbook in the given bytes to read, without writing it to a file first.
+
+        The format, `xls` or `xlsx`, is detected from the content. Read keywords work as with `Open Excel`, but the
+        workbook is not cached and `Get Workbook Values` reads it in the current process whatever its `Workers`.
+
+        Arguments:
+                |  Content (bytes)                  | The content of an Excel file, such as returned by `Get Binary File`.                                  |
+                |  Mode (Default: `default`)        | Available options: `default`, `streaming` (only `xlsx`)                                               |
+                |  Alias (Default: `read`)          | The alias to switch back to this workbook with `Switch Excel`.                                        |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |
+        | ${content}=           |  Get Binary File                                   |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
+        | Open Excel From Bytes |  ${content}                                        |
 
         """
-        self.reader = ExcelReader(file_path, self.date_format, self.number_format, self.bool_format)
+        self.reader = ExcelReader(None, self.date_format, self.number_format, self.bool_format, mode,
+                                  file_contents=content)
+        return self._excels.register(self.reader, alias or DEFAULT_READ_ALIAS)
 
-    def open_excel_to_write(self, file_path, new_path=None, override=False):
+    def open_excel_to_write(self, file_path, new_path=None, override=False, use_for_reading=False, alias=None):
         """
         Opens the Excel file to write from the path provided in the file name parameter.
         In case `New Path` is given, new file will be created based on content of current file.
 
+        In case `Use For Reading` is `True`, read keywords work on the in-memory workbook of this writer, so written
+        values can be verified without `Save Excel` and `Open Excel` again, until another file is opened to read.
+
         Arguments:
-                |  File Path (string)           | The Excel file name or path will be opened. If file name then openning file in current directory. |
-                |  New Path                     | New path will be saved.                                                                           |
-                |  Override (Default: `False`)  | If `True`, new file will be overriden if it exists.                                               |
+                |  File Path (string)                   | The Excel file name or path will be opened. If file name then openning file in current directory. |
+                |  New Path                             | New path will be saved.                                                                           |
+                |  Override (Default: `False`)          | If `True`, new file will be overriden if it exists.                                               |
+                |  Use For Reading (Default: `False`)   | If `True`, read keywords read the written workbook.                                               |
+                |  Alias (Default: `write`)             | The alias to switch back to this file with `Switch Excel`.                                        |
         Example:
 
-        | *Keywords*                |  *Parameters*                                      |
-        | Open Excel To Write       |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
+        | *Keywords*                |  *Parameters*                                      |                                   |
+        | Open Excel To Write       |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |                                   |
+        | Open Excel To Write       |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  | use_for_reading=True              |
+        | Write To Cell By Name     |  TestSheet1                                        |  A2  |  User9                     |
+        | Read Cell Data By Name    |  TestSheet1                                        |  A2  |                            |
 
         """
         self.writer = ExcelWriter(file_path, new_path, override, self.date_format, self.number_format, self.bool_format)
+        if use_for_reading:
+            self.reader = self.writer
+        alias = self._excels.register(self.writer, alias or DEFAULT_WRITE_ALIAS)
+        if self.reader is not None and self.reader not in self._excels:
+            # The writer used for reading was replaced and closed
+            self.reader = None
+        return alias
+
+    def switch_excel(self, alias):
+        """
+        Switches to the Excel file that was opened before with the given alias.
+
+        Switching to a file opened by `Open Excel` makes it the file of the read keywords, switching to a file opened by
+        `Open Excel To Write` makes it the file of the write keywords. Opened files stay in memory until closed.
+        Opening another file with the same alias closes and replaces it, files opened without alias use the alias
+        `read` or `write`, so they are closed by the next file opened without alias.
+
+        Arguments:
+                |  Alias (string)   | The alias given to `Open Excel` or `Open Excel To Write`.  |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |                   |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\Input.xls           |  alias=input      |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\Output.xls          |  alias=output     |
+        | Switch Excel          |  input                                             |                   |
+
+        """
+        handle = self._excels.switch(alias)
+        if isinstance(handle, ExcelWriter):
+            self.writer = handle
+        else:
+            self.reader = handle
+
+    def close_excel(self, alias=None):
+        """
+        Closes the Excel file opened with the given alias, by default the last opened or switched one.
+
+        Changes of a file opened to write that are not saved are lost.
+
+        Arguments:
+                |  Alias (string)   | The alias given to `Open Excel` or `Open Excel To Write`.  |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |                   |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\Input.xls           |  alias=input      |
+        | Close Excel           |  input                                             |                   |
+
+        """
+        handle = self._excels.close(alias)
+        if handle is self.reader:
+            self.reader = None
+        if handle is self.writer:
+            self.writer = None
+
+    def close_all_excel(self):
+        """
+        Closes all opened Excel files.
+
+        Example:
+
+        | *Keywords*            |
+        | Close All Excel       |
+
+        """
+        self._excels.close_all()
+        self.reader = None
+        self.writer = None
 
     def get_sheet_names(self):
         """
@@ -143,6 +266,9 @@ class ExcelLibrary(object):
         """
         Returns the values from the sheet name specified.
 
+        Without empty cells, only the cells with values are visited, so a sparse sheet is read in a time proportional
+        to its filled cells.
+
         Arguments:
                 |  Sheet Name (string                       | The selected sheet that the cell values will be returned from.    |
                 |  Include Empty Cells (Default: `True`)    | If `False` then only return cells with values.                    |
@@ -155,20 +281,108 @@ class ExcelLibrary(object):
         """
         return self.reader.get_sheet_values(sheet_name, include_empty_cells)
 
-    def get_workbook_values(self, include_empty_cells=True):
+    def get_sheet_values_as_table(self, sheet_name, header_row=None):
+        """
+        Returns the values from the sheet name specified as a list of rows, in row-major order.
+
+        Unlike `Get Sheet Values`, cells are not named nor sorted, which makes it much faster on big sheets.
+        If `Header Row` is given, each row below it is returned as a dictionary keyed by the header values.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the cell values will be returned from.    |
+                |  Header Row (int) (Default: `None`)       | The row integer value of the header row.                          |
+        Example:
+
+        | *Keywords*                    |  *Parameters*                                          |
+        | Open Excel                    |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |   |
+        | Get Sheet Values As Table     |  TestSheet1                                        |   |
+        | Get Sheet Values As Table     |  TestSheet1                                        | 0 |
+
+        """
+        return self.reader.get_sheet_values_as_table(sheet_name, header_row)
+
+    def get_row_values_as_table(self, sheet_name, start_row, end_row=None, header_row=None):
+        """
+        Returns the values of the rows from `Start Row` to `End Row` as a list of rows, in row-major order.
+
+        If `Header Row` is given, each row is returned as a dictionary keyed by the header values.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the row values will be returned from.     |
+                |  Start Row (int)                          | The first row integer value to return.                            |
+                |  End Row (int) (Default: `None`)          | The last row integer value to return. `None` means the last row.  |
+                |  Header Row (int) (Default: `None`)       | The row integer value of the header row.                          |
+        Example:
+
+        | *Keywords*                |  *Parameters*                                              |
+        | Open Excel                |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |   |   |
+        | Get Row Values As Table   |  TestSheet1                                        | 1 | 2 |
+
+        """
+        return self.reader.get_row_values_as_table(sheet_name, start_row, end_row, header_row)
+
+    def get_column_values_as_table(self, sheet_name, columns, header_row=None):
+        """
+        Returns the values of the given columns as a list of rows, in row-major order.
+
+        If `Header Row` is given, each row below it is returned as a dictionary keyed by the header values.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the column values will be returned from.  |
+                |  Columns (list|string)                    | The column integer values, as a list or separated by comma.       |
+                |  Header Row (int) (Default: `None`)       | The row integer value of the header row.                          |
+        Example:
+
+        | *Keywords*                    |  *Parameters*                                              |
+        | Open Excel                    |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |       |   |
+        | Get Column Values As Table    |  TestSheet1                                        | 0,1   | 0 |
+
+        """
+        return self.reader.get_column_values_as_table(sheet_name, columns, header_row)
+
+    def get_workbook_values(self, include_empty_cells=True, workers=1):
         """
         Returns the values from each sheet of the current workbook.
 
+        With more than one `Workers`, sheets of an `xls` file are read in parallel by a pool of processes. The result
+        is in the order of the sheets whatever the number of workers. `xlsx` file is always read in the current
+        process, since every worker would parse the whole workbook; use `Read Excel Files` to read several files in
+        parallel.
+
         Arguments:
                 |  Include Empty Cells (Default: `True`)    | If `False` then only return cells with values.                    |
+                |  Workers (Default: `1`)                   | Number of processes. `0` uses one process per CPU.                |
         Example:
 
-        | *Keywords*           |  *Parameters*                                      |
-        | Open Excel           |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
-        | Get Workbook Values  |                                                    |
+        | *Keywords*           |  *Parameters*                                      |           |
+        | Open Excel           |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |           |
+        | Get Workbook Values  |                                                    |           |
+        | Get Workbook Values  |  True                                              | workers=4 |
+
+        """
+        return self.reader.get_workbook_values(include_empty_cells, workers)
+
+    def read_excel_files(self, pattern, include_empty_cells=True, workers=1):
+        """
+        Returns the values from each sheet of every Excel file matching the glob pattern, by file path.
+
+        Files are read by a pool of processes and returned in natural order of their paths whatever the number of
+        workers. The current Excel file is not changed.
+
+        Arguments:
+                |  Pattern (string)                         | Glob pattern of the files, `**` matches any sub directory.        |
+                |  Include Empty Cells (Default: `True`)    | If `False` then only return cells with values.                    |
+                |  Workers (Default: `1`)                   | Number of processes. `0` uses one process per CPU.                |
+        Example:
+
+        | *Keywords*    |  *Parameters*      |                                          |           |
+        | ${files}=     |  Read Excel Files  |  C:\\Python27\\ExcelRobotTest\\*.xlsx         | workers=0 |
 
         """
-        return self.reader.get_workbook_values(include_empty_cells)
+        files = find_files(pattern)
+        values = map_in_processes(read_workbook_values, [(file_path, DEFAULT_MODE, include_empty_cells)
+                                                         for file_path in files], workers)
+        return OrderedDict(zip(files, values))
 
     def read_cell_data_by_name(self, sheet_name, cell_name, data_type=None, use_format=True):
         """
@@ -213,6 +427,271 @@ class ExcelLibrary(object):
         """
         return self.reader.read_cell_data(sheet_name, column, row, data_type, use_format)
 
+    def read_range(self, sheet_name, range_name, data_type=None, use_format=True):
+        """
+        Uses the range name to return the data of its cells as a list of rows.
+
+        Cells are converted as `Read Cell Data` does, but the conversion is resolved once per column instead of once
+        per cell, which makes it the fastest way to verify a whole report section.
+        Range name accepts `A1:D10`, whole columns `B:C`, whole rows `3:5` and the sheet prefix `Sheet1!A1:D10`.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the cell values will be returned from.            |
+                |  Range Name (string)                      | The selected range that the values will be returned from.                 |
+                |  Data Type (string)                       | Available options: `TEXT`, DATE`, `TIME`, `DATETIME`, `NUMBER`, `BOOL`    |
+                |  Use Format (boolean) (Default: `True`)   | Use format to convert data to string.                                     |
+        Example:
+
+        | *Keywords*    |  *Parameters*                                                   |
+        | Open Excel    |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |            |
+        | Read Range    |  TestSheet1                                        |  A1:B3     |
+
+        """
+        return self.reader.read_range(sheet_name, range_name, data_type, use_format)
+
+    def open_row_cursor(self, sheet_name, start_row=0, use_format=True):
+        """
+        Opens a cursor on the rows of the sheet and returns its id, to read the rows page by page with `Fetch Rows`.
+
+        Rows are only read and converted when fetched, so a `FOR` or `WHILE` loop over a large sheet holds one page
+        of rows at a time instead of the whole sheet. With the file opened in `streaming` mode, the sheet itself is
+        not loaded in memory either. Cells are converted as `Read Cell Data` does.
+        The cursor belongs to the current file to read, it is closed by `Close Row Cursor` or when the file is closed.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the rows will be read from.   |
+                |  Start Row (int) (Default: `0`)           | The index of the first row to read.                   |
+                |  Use Format (boolean) (Default: `True`)   | Use format to convert data to string.                 |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                       |               |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\Export.xlsx         |  streaming    |
+        | ${cursor}=            |  Open Row Cursor                                    |  TestSheet1   |
+        | ${rows}=              |  Fetch Rows                                         |  ${cursor}    |
+        | Close Row Cursor      |  ${cursor}                                          |               |
+
+        """
+        return self.reader.open_row_cursor(sheet_name, start_row, use_format)
+
+    def fetch_rows(self, cursor, size=1000):
+        """
+        Returns the next rows of the cursor as a list of at most `Size` rows, or an empty list when all rows have been
+        fetched.
+
+        Arguments:
+                |  Cursor (int)                             | The id returned by `Open Row Cursor`.                 |
+                |  Size (int) (Default: `1000`)             | The maximum number of rows of the page.               |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                       |               |               |
+        | ${cursor}=            |  Open Row Cursor                                    |  TestSheet1   |               |
+        | WHILE                 |  True                                               |               |               |
+        |                       |  ${rows}=                                           |  Fetch Rows   |  ${cursor}    |
+        |                       |  IF                                                 |  not ${rows}  |  BREAK        |
+        |                       |  FOR                                                |  ${row}       |  IN  @{rows}  |
+        |                       |  ...                                                |               |               |
+        | END                   |                                                     |               |               |
+        | Close Row Cursor      |  ${cursor}                                          |               |               |
+
+        """
+        return self.reader.fetch_rows(cursor, size)
+
+    def close_row_cursor(self, cursor):
+        """
+        Closes the cursor and returns the index of the row it would have fetched next.
+
+        Arguments:
+                |  Cursor (int)                             | The id returned by `Open Row Cursor`.                 |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                       |               |
+        | ${cursor}=            |  Open Row Cursor                                    |  TestSheet1   |
+        | Close Row Cursor      |  ${cursor}                                          |               |
+
+        """
+        return self.reader.close_row_cursor(cursor)
+
+    def find_row_by_value(self, sheet_name, column, value):
+        """
+        Returns the first row index of which the column has the given value, or `None` if not found.
+
+        Values are compared by their text form, so `57` matches a number cell `57` as well as a text cell `57`.
+        The lookup uses a hash index of the column, which is built on the first search and kept until the workbook is
+        reloaded.
+
+        Arguments:
+                |  Sheet Name (string)  | The selected sheet that the row will be searched from.  |
+                |  Column (int)         | The column integer value that will be searched.         |
+                |  Value                | The value to search.                                    |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                              |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |   |         |
+        | ${row}=               |  Find Row By Value                                 | 0 | User1   |
+
+        """
+        return self.reader.find_row_by_value(sheet_name, column, value)
+
+    def find_rows_by_values(self, sheet_name, columns, values):
+        """
+        Returns the row indexes of which the columns have the given values, as a composite key.
+
+        See `Find Row By Value` for more details.
+
+        Arguments:
+                |  Sheet Name (string)      | The selected sheet that the rows will be searched from.                   |
+                |  Columns (list|string)    | The column integer values, as a list or separated by comma.               |
+                |  Values (list|string)     | The values to search in the same order, as a list or separated by comma.  |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                              |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |       |           |
+        | ${rows}=              |  Find Rows By Values                               | 0,1   | User1,57  |
+
+        """
+        return self.reader.find_rows_by_values(sheet_name, columns, values)
+
+    def find_cells_matching(self, pattern, mode='literal', sheet_name=None, range_name=None, max_matches=0):
+        """
+        Returns the references of the text cells matching the pattern, such as `TestSheet1!A2`, in the order of
+        sheets, rows and columns.
+
+        In `literal` and `ignore_case` modes, a cell matches if its text contains the pattern, in `regex` mode if the
+        pattern matches anywhere in its text. Only text cells are searched.
+        The workbook is scanned in the library and each distinct text is tested once, however many cells repeat it.
+        The scan stops as soon as `Max Matches` cells are found. Sheet names that are not plain words are quoted in
+        the references, as `'Graph Data'!B2`, which `Read Range` accepts.
+
+        Arguments:
+                |  Pattern (string)                         | The text or regular expression to search.                                         |
+                |  Mode (Default: `literal`)                | Available options: `literal`, `ignore_case`, `regex`                              |
+                |  Sheet Name (Default: `None`)             | The sheet to search, all sheets by default.                                       |
+                |  Range Name (Default: `None`)             | The range to search, such as `A1:D10` or `TestSheet1!A:A`.                        |
+                |  Max Matches (int) (Default: `0`)         | The maximum number of references to return, `0` for all.                         |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |                   |                   |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |                   |                   |
+        | ${cells}=             |  Find Cells Matching                               |  User             |                   |
+        | ${cells}=             |  Find Cells Matching                               |  ^User\\\\d$      |  mode=regex       |
+        | ${cells}=             |  Find Cells Matching                               |  user             |  mode=ignore_case |  sheet_name=TestSheet1  |  max_matches=1  |
+
+        """
+        return self.reader.find_cells_matching(pattern, mode, sheet_name, range_name, max_matches)
+
+    def export_sheet_to_csv(self, sheet_name, file_path, delimiter=',', header_row=None, use_format=True,
+                            encoding='utf-8'):
+        """
+        Exports the rows of the sheet to a CSV file and returns the number of exported rows.
+
+        Rows are written one by one as they are read, so a large sheet is not loaded in memory as a whole. With
+        `Use Format`, dates, numbers and booleans are formatted as `Read Cell Data` does, else their values are
+        written as is.
+
+        Arguments:
+                |  Sheet Name (string)                  | The selected sheet that the rows will be exported from.                       |
+                |  File Path (string)                   | The CSV file to write, replaced if it exists.                                 |
+                |  Delimiter (Default: `,`)             | The field delimiter.                                                          |
+                |  Header Row (Default: `None`)         | The row of the header. Only this row and the rows below it are exported.      |
+                |  Use Format (Default: `True`)         | Use format to convert values to string.                                       |
+                |  Encoding (Default: `utf-8`)          | The encoding of the CSV file.                                                 |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |               |                                   |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |               |                                   |
+        | Export Sheet To CSV   |  TestSheet1                                        |  export.csv   |  delimiter=;                      |
+
+        """
+        return self.reader.export_sheet_to_csv(sheet_name, file_path, delimiter, header_row, use_format, encoding)
+
+    def export_sheet_to_jsonl(self, sheet_name, file_path, header_row=None, use_format=True, encoding='utf-8'):
+        """
+        Exports the rows of the sheet to a JSON Lines file and returns the number of exported rows.
+
+        Each row is written on its own line as soon as it is read, as an object keyed by the values of the header
+        row if `Header Row` is given, else as an array. Without `Use Format`, dates are written in ISO format.
+
+        Arguments:
+                |  Sheet Name (string)                  | The selected sheet that the rows will be exported from.                       |
+                |  File Path (string)                   | The JSON Lines file to write, replaced if it exists.                          |
+                |  Header Row (Default: `None`)         | The row of the header. Only the rows below it are exported.                   |
+                |  Use Format (Default: `True`)         | Use format to convert values to string.                                       |
+                |  Encoding (Default: `utf-8`)          | The encoding of the JSON Lines file.                                          |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |               |                                   |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |               |                                   |
+        | Export Sheet To JSONL |  TestSheet1                                        |  export.jsonl |  header_row=0                     |
+
+        """
+        return self.reader.export_sheet_to_jsonl(sheet_name, file_path, header_row, use_format, encoding)
+
+    def compare_excel_sheets(self, sheet_name, other_alias, other_sheet_name=None, number_tolerance=0,
+                             date_tolerance=0, max_differences=100):
+        """
+        Compares the sheet of the current Excel file with the sheet of the Excel file opened with `Other Alias`, and
+        returns a summary of the differences.
+
+        Rows are aligned by their values, so inserted or deleted rows are reported as such instead of shifting every
+        following row. Rows that differ in place are compared cell by cell.
+
+        The summary is a dictionary of
+        | equal                 | `True` if no difference is found.                                                             |
+        | equal_rows            | Number of equal rows.                                                                         |
+        | changed_rows          | Number of rows that differ in place.                                                          |
+        | removed_rows          | Indexes of the rows of the current sheet that are not in the other sheet.                     |
+        | added_rows            | Indexes of the rows of the other sheet that are not in the current sheet.                     |
+        | changed_cells         | Number of different cells in the changed rows.                                                |
+        | cells                 | First different cells as `(cell name, other cell name, value, other value)`.                  |
+
+        Arguments:
+                |  Sheet Name (string)                  | The selected sheet of the current Excel file.                                 |
+                |  Other Alias (string)                 | The alias of the Excel file to compare with.                                  |
+                |  Other Sheet Name (Default: `None`)   | The sheet of the other Excel file. Same as `Sheet Name` by default.           |
+                |  Number Tolerance (Default: `0`)      | Numbers are equal if they differ by this value at most.                       |
+                |  Date Tolerance (Default: `0`)        | Dates are equal if they differ by this number of seconds at most.             |
+                |  Max Differences (Default: `100`)     | Maximum number of different cells that are reported.                          |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |                   |                       |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\Expected.xls        |  alias=expected   |                       |
+        | Open Excel            |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |                   |                       |
+        | ${diff}=              |  Compare Excel Sheets                              |  TestSheet1       |  expected             |
+        | Should Be True        |  ${diff}[equal]                                    |                   |                       |
+
+        """
+        return self.reader.compare_sheet(sheet_name, self._excels.get(other_alias), other_sheet_name,
+                                         number_tolerance, date_tolerance, max_differences)
+
+    def compare_excel_files(self, file_path, other_file_path, number_tolerance=0, date_tolerance=0,
+                            max_differences=100):
+        """
+        Compares the sheets of two Excel files by sheet name, and returns a summary of the differences.
+
+        The summary is a dictionary of `equal`, `removed_sheets` (only in the first file), `added_sheets` (only in
+        the other file) and `sheets`, the summary of each common sheet as returned by `Compare Excel Sheets`. The
+        current Excel file is not changed.
+
+        Arguments:
+                |  File Path (string)                   | The first Excel file.                                                         |
+                |  Other File Path (string)             | The Excel file to compare with.                                               |
+                |  Number Tolerance (Default: `0`)      | Numbers are equal if they differ by this value at most.                       |
+                |  Date Tolerance (Default: `0`)        | Dates are equal if they differ by this number of seconds at most.             |
+                |  Max Differences (Default: `100`)     | Maximum number of different cells that are reported per sheet.                |
+        Example:
+
+        | *Keywords*    |  *Parameters*          |                                             |                                                   |
+        | ${diff}=      |  Compare Excel Files   |  C:\\Python27\\ExcelRobotTest\\Expected.xls  |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
+
+        """
+        first = ExcelReader(file_path, self.date_format, self.number_format, self.bool_format)
+        other = ExcelReader(other_file_path, self.date_format, self.number_format, self.bool_format)
+        try:
+            return first.compare_workbook(other, number_tolerance, date_tolerance, max_differences)
+        finally:
+            first.close()
+            other.close()
+
     def check_cell_type(self, sheet_name, column, row, data_type):
         """
         Checks the type of value that is within the cell of the sheet name selected.
@@ -276,6 +755,134 @@ class ExcelLibrary(object):
         """
         self.writer.write_to_cell(sheet_name, column, row, value, data_type)
 
+    def write_range(self, sheet_name, cell_name, rows, data_types=None):
+        """
+        Write a 2-D list of values to the given sheet, starting at the cell that defines by name.
+
+        The sheet is resolved and the data type conversion is decided once per column, so writing a whole table costs
+        one keyword call. If `Data Types` is not provided, `ExcelRobot` will introspect data type from each value.
+        Empty values (`None`) are skipped.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the cells will be modified from.                          |
+                |  Cell Name (string)                       | The top left cell name that the values will be written from.                      |
+                |  Rows (list of list)                      | The values to write, row by row.                                                  |
+                |  Data Types (string|list)                 | One data type for all cells, or a list (or comma separated) of data type per column |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                                                  |
+        | Open Excel To Write   |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |      |              |              |
+        | Write Range           |  TestSheet1                                        |  A2  |  ${rows}     | TEXT,NUMBER  |
+
+        """
+        self.writer.write_range(sheet_name, cell_name, rows, data_types)
+
+    def write_rows(self, sheet_name, column, row, rows, data_types=None):
+        """
+        Write a 2-D list of values to the given sheet, starting at the cell that defines by column and row.
+
+        See `Write Range` for more details.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the cells will be modified from.                          |
+                |  Column (int)                             | The column integer value that the values will be written from.                    |
+                |  Row (int)                                | The row integer value that the values will be written from.                       |
+                |  Rows (list of list)                      | The values to write, row by row.                                                  |
+                |  Data Types (string|list)                 | One data type for all cells, or a list (or comma separated) of data type per column |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                                                     |
+        | Open Excel To Write   |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |     |     |           |         |
+        | Write Rows            |  TestSheet1                                        |  0  |  1  |  ${rows}  |         |
+
+        """
+        self.writer.write_rows(sheet_name, column, row, rows, data_types)
+
+    def append_rows(self, sheet_name, rows, column=0, data_types=None):
+        """
+        Write a 2-D list of values to the given sheet, below the last used row.
+
+        See `Write Range` for more details.
+
+        Arguments:
+                |  Sheet Name (string)                      | The selected sheet that the cells will be modified from.                          |
+                |  Rows (list of list)                      | The values to write, row by row.                                                  |
+                |  Column (int) (Default: `0`)              | The column integer value that the values will be written from.                    |
+                |  Data Types (string|list)                 | One data type for all cells, or a list (or comma separated) of data type per column |
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |           |
+        | Open Excel To Write   |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |           |
+        | Append Rows           |  TestSheet1                                        |  ${rows}  |
+
+        """
+        self.writer.append_rows(sheet_name, rows, column, data_types)
+
+    def get_style_stats(self):
+        """
+        Returns the counters of the style registry of the `xls` file that was opened to write before.
+
+        Cell styles of `xls` file are built once per number format and reused, `hits` counts the reused styles and
+        `styles` the number of unique styles. This keyword fails for `xlsx` file, which has no such registry since
+        openpyxl shares number formats in the workbook itself.
+
+        Example:
+
+        | *Keywords*            |  *Parameters*                                      |
+        | Open Excel To Write   |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
+        | ${stats}=             |  Get Style Stats                                   |
+
+        """
+        return self.writer.get_style_stats()
+
+    def get_excel_metrics(self, reset=False):
+        """
+        Returns the metrics collected since the library was imported with `metrics=True`, or since the last reset.
+
+        The metrics are a dictionary of
+        | enabled       | `True` if metrics are collected.                                                                  |
+        | counters      | `cells_read`, `cells_written`, `bytes_saved` and `bytes_exported`.                                |
+        | timers        | Number of calls and seconds spent in `parse`, `copy`, `convert` and `save`.                       |
+        | keywords      | Number of calls and seconds of each keyword of the library.                                       |
+        | suites        | `keywords`, `counters` and `timers` of each finished suite, slowest keywords first.               |
+
+        Metrics can also be collected without changing the library import, with the listener
+        `ExcelRobot.listener.ExcelMetricsListener`, which saves them to the JSON file given as argument.
+
+        Arguments:
+                |  Reset (Default: `False`)     | If `True`, metrics are cleared after being returned.  |
+        Example:
+
+        | *Settings*            |  *Parameters*         |                   |
+        | Library               |  ExcelRobot           |  metrics=True     |
+
+        | *Keywords*            |  *Parameters*         |
+        | ${metrics}=           |  Get Excel Metrics    |
+        | Log                   |  ${metrics}[keywords] |
+
+        """
+        metrics = METRICS.snapshot()
+        if reset:
+            METRICS.reset()
+        return metrics
+
+    def get_sheet_residency_stats(self):
+        """
+        Returns the counters of the sheets loaded from `xls` workbooks.
+
+        `hits` counts the accesses to loaded sheets, `misses` the sheets parsed on access and `evictions` the sheets
+        unloaded to stay within `Max Resident Sheets` and `Max Resident Sheet Size`. Sheets are only tracked when one
+        of these limits is set, so all counters stay `0` without limit.
+
+        Example:
+
+        | *Keywords*                    |  *Parameters*                                      |
+        | Open Excel                    |  C:\\Python27\\ExcelRobotTest\\ExcelRobotTest.xls  |
+        | ${stats}=                     |  Get Sheet Residency Stats                         |
+
+        """
+        return SHEET_RESIDENCY.stats()
+
     # def modify_cell_with(self, sheet_name, column, row, op, val):
     #     """
     #     Using the sheet name a cell is modified with the given operation and value.
@@ -295,10 +902,15 @@ class ExcelLibrary(object):
     #     """
     #     self.writer.modify_cell_with(sheet_name, column, row, op, val)
 
-    def save_excel(self):
+    def save_excel(self, fsync=False, backup=False):
         """
         Saves the Excel file that was opened to write before.
 
+        The file is written to a temporary file next to the destination, then atomically replaces it.
+
+        Arguments:
+                |  Fsync (boolean) (Default: `False`)   | Flush the saved file to disk before returning.              |
+                |  Backup (boolean) (Default: `False`)  | Keep the previous content of the file as `<file name>.bak`. |
         Example:
 
         | *Keywords*            |  *Parameters*                                      |
@@ -307,7 +919,7 @@ class ExcelLibrary(object):
         | Save Excel            |                                                    |                  |
 
         """
-        self.writer.save_excel()
+        self.writer.save_excel(fsync, backup)
 
     def create_sheet(self, sheet_name):
         """
@@ -323,3 +935,32 @@ class ExcelLibrary(object):
 
         """
         self.writer.create_sheet(sheet_name)
+
+    def import_csv_to_excel(self, csv_path, file_path, sheet_name='Sheet1', data_types=None, delimiter=',',
+                            header=False, encoding='utf-8', override=False):
+        """
+        Creates an Excel file with one sheet from the rows of a CSV file, and returns the number of imported rows.
+
+        Rows are converted and written one by one, so memory stays flat even with millions of rows. Values are
+        written as text unless a data type is given for their column, in which case they are parsed with the
+        configured date, number and boolean formats. Empty values are left as empty cells. The current Excel file is
+        not changed.
+
+        Arguments:
+                |  CSV Path (string)                    | The CSV file to import.                                                       |
+                |  File Path (string)                   | The Excel file to create.                                                     |
+                |  Sheet Name (Default: `Sheet1`)       | The name of the sheet.                                                        |
+                |  Data Types (Default: `None`)         | One data type for every column or comma separated data type per column.       |
+                |  Delimiter (Default: `,`)             | The field delimiter.                                                          |
+                |  Header (Default: `False`)            | If `True`, the first row is written as text whatever the data types.          |
+                |  Encoding (Default: `utf-8`)          | The encoding of the CSV file.                                                 |
+                |  Override (Default: `False`)          | If `True`, the Excel file will be overriden if it exists.                     |
+        Example:
+
+        | *Keywords*            |  *Parameters*  |                                                |                   |                           |
+        | Import CSV To Excel   |  users.csv     |  C:\\Python27\\ExcelRobotTest\\Users.xlsx        |  Users            |  TEXT,NUMBER,DATE         |
+
+        """
+        converter = ValueConverter(self.date_format, self.number_format, self.bool_format)
+        return import_csv(csv_path, file_path, sheet_name, data_types, delimiter, header, encoding, override,
+                          converter)
@@ -0,0 +1,246 @@
+import logging
+
+from ExcelRobot.cache import SHEET_RESIDENCY
+from ExcelRobot.streaming import get_datemode, to_xlrd_cell
+from xlrd import XL_CELL_EMPTY, XLRDError
+from xlrd.sheet import Cell
+
+LOGGER = logging.getLogger(__name__)
+
+
+class OpenpyxlSheet(object):
+    """
+    View of an in-memory openpyxl worksheet that mimics the API of `xlrd.sheet.Sheet`.
+
+    Cells are read from the live model without creating missing ones, so values written through the worksheet are
+    visible immediately.
+    """
+
+    def __init__(self, worksheet, datemode=0):
+        self.name = worksheet.title
+        self._worksheet = worksheet
+        self._datemode = datemode
+        self._dimension = (-1, 0, 0)
+
+    def _get_dimension(self):
+        # openpyxl computes the dimension from every cell, so it is only computed again when cells are added
+        cells = self._worksheet._cells
+        if self._dimension[0] != len(cells):
+            nrows = max(row for row, _ in cells) if cells else 0
+            ncols = max(col for _, col in cells) if cells else 0
+            self._dimension = (len(cells), nrows, ncols)
+        return self._dimension
+
+    @property
+    def nrows(self):
+        return self._get_dimension()[1]
+
+    @property
+    def ncols(self):
+        return self._get_dimension()[2]
+
+    def _cell(self, rowx, colx):
+        cell = self._worksheet._cells.get((int(rowx) + 1, int(colx) + 1))
+        if cell is None:
+            return XL_CELL_EMPTY, ''
+        return to_xlrd_cell(cell.value, cell.data_type, self._datemode)
+
+    def _check_row(self, rowx):
+        if int(rowx) < 0 or int(rowx) >= self.nrows:
+            raise IndexError('Row index out of range')
+
+    def cell(self, rowx, colx):
+        self._check_row(rowx)
+        return Cell(*self._cell(rowx, colx))
+
+    def cell_value(self, rowx, colx):
+        return self.cell(rowx, colx).value
+
+    def cell_type(self, rowx, colx):
+        return self.cell(rowx, colx).ctype
+
+    def _row(self, rowx, start_colx=0, end_colx=None):
+        self._check_row(rowx)
+        end_colx = self.ncols if end_colx is None else end_colx
+        return [self._cell(rowx, colx) for colx in range(start_colx, end_colx)]
+
+    def row_values(self, rowx, start_colx=0, end_colx=None):
+        return [value for _, value in self._row(rowx, start_colx, end_colx)]
+
+    def row_types(self, rowx, start_colx=0, end_colx=None):
+        return [ctype for ctype, _ in self._row(rowx, start_colx, end_colx)]
+
+    def row_len(self, rowx):
+        return self.ncols
+
+    def _col(self, colx, start_rowx=0, end_rowx=None):
+        end_rowx = self.nrows if end_rowx is None else end_rowx
+        return [self._cell(rowx, colx) for rowx in range(start_rowx, end_rowx)]
+
+    def col_values(self, colx, start_rowx=0, end_rowx=None):
+        return [value for _, value in self._col(colx, start_rowx, end_rowx)]
+
+    def col_types(self, colx, start_rowx=0, end_rowx=None):
+        return [ctype for ctype, _ in self._col(colx, start_rowx, end_rowx)]
+
+    def get_rows(self):
+        for rowx in range(self.nrows):
+            yield [Cell(ctype, value) for ctype, value in self._row(rowx)]
+
+
+class OpenpyxlBook(object):
+    """
+    View of an in-memory openpyxl workbook that mimics the API of `xlrd.book.Book`.
+    """
+
+    def __init__(self, workbook):
+        self._workbook = workbook
+        self.datemode = get_datemode(workbook)
+        self._sheets = {}
+
+    @property
+    def nsheets(self):
+        return len(self._workbook.sheetnames)
+
+    def sheet_names(self):
+        return list(self._workbook.sheetnames)
+
+    def sheet_by_name(self, sheet_name):
+        worksheet = self._workbook[sheet_name]
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None or sheet._worksheet is not worksheet:
+            sheet = self._sheets[sheet_name] = OpenpyxlSheet(worksheet, self.datemode)
+        return sheet
+
+    def sheet_by_index(self, sheetx):
+        return self.sheet_by_name(self._workbook.sheetnames[sheetx])
+
+    def release_resources(self):
+        pass
+
+
+class SheetOverlay(object):
+    """
+    Cells written to a sheet, kept in xlrd representation to be read on top of the parsed sheet.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self.nrows = 0
+        self.ncols = 0
+
+    def write(self, rowx, colx, value, datemode=0):
+        self.rows.setdefault(rowx, {})[colx] = to_xlrd_cell(value, None, datemode)
+        self.nrows = max(self.nrows, rowx + 1)
+        self.ncols = max(self.ncols, colx + 1)
+
+
+class OverlaySheet(object):
+    """
+    View of an xlrd sheet with the cells written since it was parsed, that mimics the API of `xlrd.sheet.Sheet`.
+    """
+
+    def __init__(self, name, sheet, overlay):
+        self.name = name
+        self._sheet = sheet
+        self._overlay = overlay
+
+    @property
+    def nrows(self):
+        return max(self._sheet.nrows if self._sheet else 0, self._overlay.nrows)
+
+    @property
+    def ncols(self):
+        return max(self._sheet.ncols if self._sheet else 0, self._overlay.ncols)
+
+    def _cell(self, rowx, colx):
+        written = self._overlay.rows.get(rowx, {}).get(colx)
+        if written:
+            return written
+        if self._sheet and rowx < self._sheet.nrows and colx < self._sheet.row_len(rowx):
+            return self._sheet.cell_type(rowx, colx), self._sheet.cell_value(rowx, colx)
+        return XL_CELL_EMPTY, ''
+
+    def cell(self, rowx, colx):
+        rowx, colx = int(rowx), int(colx)
+        if rowx < 0 or rowx >= self.nrows:
+            raise IndexError('Row index out of range')
+        return Cell(*self._cell(rowx, colx))
+
+    def cell_value(self, rowx, colx):
+        return self.cell(rowx, colx).value
+
+    def cell_type(self, rowx, colx):
+        return self.cell(rowx, colx).ctype
+
+    def _row(self, rowx, start_colx=0, end_colx=None):
+        rowx = int(rowx)
+        if rowx < 0 or rowx >= self.nrows:
+            raise IndexError('Row index out of range')
+        end_colx = self.ncols if end_colx is None else end_colx
+        types, values = [], []
+        if self._sheet and rowx < self._sheet.nrows:
+            types = list(self._sheet.row_types(rowx, start_colx, end_colx))
+            values = list(self._sheet.row_values(rowx, start_colx, end_colx))
+        padding = end_colx - start_colx - len(types)
+        types.extend([XL_CELL_EMPTY] * padding)
+        values.extend([''] * padding)
+        for colx, (ctype, value) in self._overlay.rows.get(rowx, {}).items():
+            if start_colx <= colx < end_colx:
+                types[colx - start_colx], values[colx - start_colx] = ctype, value
+        return types, values
+
+    def row_values(self, rowx, start_colx=0, end_colx=None):
+        return self._row(rowx, start_colx, end_colx)[1]
+
+    def row_types(self, rowx, start_colx=0, end_colx=None):
+        return self._row(rowx, start_colx, end_colx)[0]
+
+    def row_len(self, rowx):
+        return self.ncols
+
+    def col_values(self, colx, start_rowx=0, end_rowx=None):
+        end_rowx = self.nrows if end_rowx is None else end_rowx
+        return [self._cell(rowx, int(colx))[1] for rowx in range(start_rowx, end_rowx)]
+
+    def col_types(self, colx, start_rowx=0, end_rowx=None):
+        end_rowx = self.nrows if end_rowx is None else end_rowx
+        return [self._cell(rowx, int(colx))[0] for rowx in range(start_rowx, end_rowx)]
+
+    def get_rows(self):
+        for rowx in range(self.nrows):
+            yield [Cell(ctype, value) for ctype, value in zip(*self._row(rowx))]
+
+
+class OverlayBook(object):
+    """
+    View of an xlrd workbook with the sheets and cells written by `XlsWriter`, that mimics the API of
+    `xlrd.book.Book`.
+    """
+
+    def __init__(self, book, writer):
+        self._book = book
+        self._writer = writer
+        self.datemode = book.datemode if book else 0
+
+    @property
+    def nsheets(self):
+        return len(self._writer.sheet_names)
+
+    def sheet_names(self):
+        return list(self._writer.sheet_names)
+
+    def sheet_by_name(self, sheet_name):
+        if sheet_name not in self._writer.sheet_names:
+            raise XLRDError('No sheet named <%r>' % sheet_name)
+        sheet = None
+        if self._book and sheet_name in self._book.sheet_names():
+            sheet = SHEET_RESIDENCY.sheet_by_name(self._book, sheet_name)
+        return OverlaySheet(sheet_name, sheet, self._writer.get_overlay(sheet_name))
+
+    def sheet_by_index(self, sheetx):
+        return self.sheet_by_name(self._writer.sheet_names[sheetx])
+
+    def release_resources(self):
+        if self._book:
+            self._book.release_resources()
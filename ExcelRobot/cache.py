@@ -0,0 +1,196 @@
+import logging
+import os
+import os.path as path
+import threading
+import weakref
+from collections import OrderedDict
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+# Approximate memory used by a parsed xlrd cell: value, type and format index
+CELL_SIZE = 64
+
+
+class WorkbookCache(object):
+    """
+    Process-wide LRU cache of parsed workbooks.
+
+    Entries are keyed by resolved path, file size and modification time, so a file that changed on disk is parsed
+    again instead of being served stale. Memory usage is approximated by the size of the source files and bounded by
+    `max_bytes`; the least recently used workbooks are evicted first. `max_bytes=0` disables the cache.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_SIZE):
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self.max_bytes = int(max_bytes)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(file_path):
+        real_path = path.realpath(file_path)
+        stat = os.stat(real_path)
+        return real_path, stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path, loader):
+        """
+        Returns the cached workbook of `file_path` or parses it with `loader(file_path)` and caches the result.
+        """
+        if self.max_bytes <= 0:
+            return loader(file_path)
+        key = self._key(file_path)
+        with self._lock:
+            workbook = self._entries.get(key)
+            if workbook is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                LOGGER.debug('Workbook cache hit: %s', key[0])
+                return workbook
+            self.misses += 1
+        workbook = loader(file_path)
+        if key[1] > self.max_bytes:
+            return workbook
+        with self._lock:
+            self._drop_path(key[0])
+            self._entries[key] = workbook
+            self.size += key[1]
+            self._evict()
+        return workbook
+
+    def invalidate(self, file_path):
+        """
+        Drops every cached version of `file_path`.
+        """
+        with self._lock:
+            self._drop_path(path.realpath(file_path))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def stats(self):
+        return {'entries': len(self._entries), 'size': self.size, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+    def _drop_path(self, real_path):
+        for key in [k for k in self._entries if k[0] == real_path]:
+            LOGGER.debug('Workbook cache invalidate: %s', real_path)
+            del self._entries[key]
+            self.size -= key[1]
+
+    def _evict(self):
+        while self._entries and self.size > self.max_bytes:
+            key, _ = self._entries.popitem(last=False)
+            LOGGER.debug('Workbook cache evict: %s', key[0])
+            self.size -= key[1]
+
+
+class SheetResidency(object):
+    """
+    Process-wide LRU of the sheets loaded in on-demand xlrd workbooks.
+
+    Sheets are loaded on first access and unloaded with `unload_sheet` once more than `max_sheets` sheets, or more
+    than `max_bytes` of cells approximated by `CELL_SIZE` per cell, are resident. An unloaded sheet is parsed again on
+    next access. `0` means no limit. Without any limit, and for workbooks that are not loaded on demand, sheets are
+    passed through without being tracked.
+    """
+
+    def __init__(self, max_sheets=0, max_bytes=0):
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._refs = {}
+        self.max_sheets = int(max_sheets)
+        self.max_bytes = int(max_bytes)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _is_managed(book):
+        return getattr(book, 'on_demand', False) and not getattr(book, '_resources_released', True)
+
+    def sheet_by_name(self, book, sheet_name):
+        """
+        Returns the sheet of `book`, loading it again if it was unloaded, and marks it as the most recently used.
+        """
+        if not (self.max_sheets or self.max_bytes) or not self._is_managed(book):
+            return book.sheet_by_name(sheet_name)
+        try:
+            sheetx = book.sheet_names().index(sheet_name)
+        except ValueError:
+            return book.sheet_by_name(sheet_name)
+        key = (id(book), sheetx)
+        with self._lock:
+            if book.sheet_loaded(sheetx):
+                self.hits += 1
+            else:
+                self.misses += 1
+                LOGGER.debug('Load sheet: %s', sheet_name)
+            sheet = book.sheet_by_index(sheetx)
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[0]() is book:
+                self.size -= entry[1]
+            size = sheet.nrows * sheet.ncols * CELL_SIZE
+            ref = self._refs.get(id(book))
+            if ref is None or ref() is not book:
+                ref = self._refs[id(book)] = weakref.ref(book, self._forget)
+            self._entries[key] = (ref, size)
+            self.size += size
+            self._evict(keep=key)
+        return sheet
+
+    def resize(self, max_sheets=None, max_bytes=None):
+        with self._lock:
+            if max_sheets is not None:
+                self.max_sheets = int(max_sheets)
+            if max_bytes is not None:
+                self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._refs.clear()
+            self.size = 0
+
+    def stats(self):
+        return {'sheets': len(self._entries), 'size': self.size, 'max_sheets': self.max_sheets,
+                'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def _forget(self, ref):
+        with self._lock:
+            for book_id in [k for k, value in self._refs.items() if value is ref]:
+                del self._refs[book_id]
+            for key in [k for k, entry in self._entries.items() if entry[0] is ref]:
+                self.size -= self._entries.pop(key)[1]
+
+    def _is_over_budget(self):
+        return (0 < self.max_sheets < len(self._entries)) or (0 < self.max_bytes < self.size)
+
+    def _evict(self, keep=None):
+        for key in list(self._entries):
+            if not self._is_over_budget():
+                break
+            if key == keep:
+                continue
+            ref, size = self._entries.pop(key)
+            self.size -= size
+            book = ref()
+            if book is not None and self._is_managed(book):
+                LOGGER.debug('Unload sheet: %s', book.sheet_names()[key[1]])
+                book.unload_sheet(key[1])
+                self.evictions += 1
+
+
+WORKBOOK_CACHE = WorkbookCache()
+SHEET_RESIDENCY = SheetResidency()
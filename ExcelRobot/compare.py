@@ -0,0 +1,269 @@
+import bisect
+import logging
+
+from xlrd import XL_CELL_DATE, XL_CELL_EMPTY, XL_CELL_NUMBER, cellname, xldate
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_DIFFERENCES = 100
+# Edits searched to align rows between two anchors before pairing them in place
+MAX_GAP_EDITS = 1000
+
+
+def _read_rows(sheet):
+    """
+    Returns the `(types, values)` of each row without trailing empty cells, so sheets of different width align.
+    """
+    rows = []
+    for rowx in range(sheet.nrows):
+        types, values = sheet.row_types(rowx), sheet.row_values(rowx)
+        width = len(types)
+        while width and types[width - 1] == XL_CELL_EMPTY:
+            width -= 1
+        rows.append((tuple(types[:width]), tuple(values[:width])))
+    return rows
+
+
+def _cells_equal(first, second, number_tolerance, date_tolerance):
+    (first_type, first_value), (second_type, second_value) = first, second
+    if first_value == second_value:
+        return True
+    if first_type == second_type == XL_CELL_NUMBER:
+        return abs(first_value - second_value) <= number_tolerance
+    if first_type == second_type == XL_CELL_DATE:
+        # Excel stores times with a millisecond precision
+        return round(abs(first_value - second_value) * 86400, 3) <= date_tolerance
+    return False
+
+
+def _report_value(ctype, value, datemode):
+    if ctype == XL_CELL_DATE:
+        try:
+            return xldate.xldate_as_datetime(value, datemode)
+        except (ValueError, OverflowError):
+            return value
+    return value
+
+
+class SheetDiff(object):
+    """
+    Differences between two sheets. Rows and cells are zero-based, cells are reported as
+    `(first cell name, second cell name, first value, second value)`.
+    """
+
+    def __init__(self, first_rows, second_rows):
+        self.first_rows = first_rows
+        self.second_rows = second_rows
+        self.equal_rows = 0
+        self.changed_rows = 0
+        self.removed_rows = []
+        self.added_rows = []
+        self.cells = []
+        self.changed_cells = 0
+
+    @property
+    def equal(self):
+        return not (self.changed_rows or self.removed_rows or self.added_rows)
+
+    def to_dict(self):
+        return {'equal': self.equal, 'first_rows': self.first_rows, 'second_rows': self.second_rows,
+                'equal_rows': self.equal_rows, 'changed_rows': self.changed_rows,
+                'removed_rows': self.removed_rows, 'added_rows': self.added_rows,
+                'changed_cells': self.changed_cells, 'cells': self.cells}
+
+
+def align_rows(first, second):
+    """
+    Returns the opcodes aligning two lists of hashable rows, as `difflib.SequenceMatcher.get_opcodes`.
+
+    Rows are aligned patience style: common leading and trailing rows are matched, then rows that are unique in both
+    lists are used as anchors and the gaps between them are aligned the same way. A gap without unique rows, such as
+    repeated rows, is aligned by the shortest edit script of at most `MAX_GAP_EDITS` rows, else paired in place.
+    """
+    matches = []
+    gaps = [(0, len(first), 0, len(second))]
+    while gaps:
+        first_lo, first_hi, second_lo, second_hi = gaps.pop()
+        while first_lo < first_hi and second_lo < second_hi and first[first_lo] == second[second_lo]:
+            matches.append((first_lo, second_lo))
+            first_lo, second_lo = first_lo + 1, second_lo + 1
+        while first_lo < first_hi and second_lo < second_hi and first[first_hi - 1] == second[second_hi - 1]:
+            first_hi, second_hi = first_hi - 1, second_hi - 1
+            matches.append((first_hi, second_hi))
+        if first_lo == first_hi or second_lo == second_hi:
+            continue
+        anchors = _unique_anchors(first, second, first_lo, first_hi, second_lo, second_hi)
+        if not anchors:
+            matches.extend(_shortest_edit_matches(first, second, first_lo, first_hi, second_lo, second_hi))
+            continue
+        for first_index, second_index in anchors:
+            gaps.append((first_lo, first_index, second_lo, second_index))
+            matches.append((first_index, second_index))
+            first_lo, second_lo = first_index + 1, second_index + 1
+        gaps.append((first_lo, first_hi, second_lo, second_hi))
+    matches.sort()
+    return _to_opcodes(matches, len(first), len(second))
+
+
+def _unique_anchors(first, second, first_lo, first_hi, second_lo, second_hi):
+    """
+    Returns the longest increasing sequence of `(first index, second index)` of the rows unique in both ranges.
+    """
+    first_unique, second_unique = {}, {}
+    for index in range(first_lo, first_hi):
+        first_unique[first[index]] = index if first[index] not in first_unique else None
+    for index in range(second_lo, second_hi):
+        second_unique[second[index]] = index if second[index] not in second_unique else None
+    pairs = [(index, second_unique.get(row)) for row, index in first_unique.items()
+             if index is not None and second_unique.get(row) is not None]
+    pairs.sort()
+    # Patience sorting: tails[k] is the smallest second index ending an increasing sequence of length k + 1
+    tails, tail_pairs, previous = [], [], []
+    for position, (_, second_index) in enumerate(pairs):
+        k = bisect.bisect_left(tails, second_index)
+        if k == len(tails):
+            tails.append(second_index)
+            tail_pairs.append(position)
+        else:
+            tails[k] = second_index
+            tail_pairs[k] = position
+        previous.append(tail_pairs[k - 1] if k else None)
+    anchors = []
+    position = tail_pairs[-1] if tail_pairs else None
+    while position is not None:
+        anchors.append(pairs[position])
+        position = previous[position]
+    anchors.reverse()
+    return anchors
+
+
+def _shortest_edit_matches(first, second, first_lo, first_hi, second_lo, second_hi, max_edits=MAX_GAP_EDITS):
+    """
+    Returns the matched `(first index, second index)` of the shortest edit script between the ranges (Myers), or no
+    match if it needs more than `max_edits` edits.
+    """
+    first_len, second_len = first_hi - first_lo, second_hi - second_lo
+    furthest = {1: 0}
+    trace = []
+    for edits in range(min(first_len + second_len, max_edits) + 1):
+        trace.append(dict(furthest))
+        for diagonal in range(-edits, edits + 1, 2):
+            if diagonal == -edits or (diagonal != edits and furthest[diagonal - 1] < furthest[diagonal + 1]):
+                x = furthest[diagonal + 1]
+            else:
+                x = furthest[diagonal - 1] + 1
+            y = x - diagonal
+            while x < first_len and y < second_len and first[first_lo + x] == second[second_lo + y]:
+                x, y = x + 1, y + 1
+            furthest[diagonal] = x
+            if x >= first_len and y >= second_len:
+                return _backtrack(trace, first_len, second_len, first_lo, second_lo)
+    LOGGER.debug('Rows %d-%d and %d-%d differ by more than %d rows, compare them in place',
+                 first_lo, first_hi, second_lo, second_hi, max_edits)
+    return []
+
+
+def _backtrack(trace, x, y, first_lo, second_lo):
+    matches = []
+    for edits in range(len(trace) - 1, 0, -1):
+        furthest, diagonal = trace[edits], x - y
+        if diagonal == -edits or (diagonal != edits and furthest[diagonal - 1] < furthest[diagonal + 1]):
+            previous = diagonal + 1
+        else:
+            previous = diagonal - 1
+        previous_x = furthest[previous]
+        previous_y = previous_x - previous
+        while x > previous_x and y > previous_y:
+            x, y = x - 1, y - 1
+            matches.append((first_lo + x, second_lo + y))
+        x, y = previous_x, previous_y
+    while x > 0 and y > 0:
+        x, y = x - 1, y - 1
+        matches.append((first_lo + x, second_lo + y))
+    return matches
+
+
+def _to_opcodes(matches, first_len, second_len):
+    opcodes = []
+    first_index = second_index = 0
+    for first_match, second_match in matches + [(first_len, second_len)]:
+        if first_index < first_match or second_index < second_match:
+            tag = ('replace' if first_index < first_match and second_index < second_match
+                   else 'delete' if first_index < first_match else 'insert')
+            opcodes.append((tag, first_index, first_match, second_index, second_match))
+        if first_match == first_len and second_match == second_len:
+            break
+        if opcodes and opcodes[-1][0] == 'equal' and opcodes[-1][2] == first_match:
+            opcodes[-1] = ('equal', opcodes[-1][1], first_match + 1, opcodes[-1][3], second_match + 1)
+        else:
+            opcodes.append(('equal', first_match, first_match + 1, second_match, second_match + 1))
+        first_index, second_index = first_match + 1, second_match + 1
+    return opcodes
+
+
+def compare_sheets(first, second, number_tolerance=0, date_tolerance=0, max_differences=DEFAULT_MAX_DIFFERENCES,
+                   first_datemode=0, second_datemode=0):
+    """
+    Compares two sheets with the xlrd sheet API and returns a `SheetDiff`.
+
+    Rows are aligned by their values, so inserted or deleted rows do not shift the comparison of the following rows.
+    Rows that differ in place are compared cell by cell: numbers equal within `number_tolerance` and dates equal
+    within `date_tolerance` seconds are not reported. Only the first `max_differences` cells are reported.
+    """
+    first_rows, second_rows = _read_rows(first), _read_rows(second)
+    diff = SheetDiff(len(first_rows), len(second_rows))
+    opcodes = align_rows([values for _, values in first_rows], [values for _, values in second_rows])
+    for tag, first_start, first_end, second_start, second_end in opcodes:
+        if tag == 'equal':
+            diff.equal_rows += first_end - first_start
+            continue
+        paired = min(first_end - first_start, second_end - second_start)
+        for offset in range(paired):
+            first_rowx, second_rowx = first_start + offset, second_start + offset
+            changed = _compare_rows(diff, first_rowx, first_rows[first_rowx], second_rowx, second_rows[second_rowx],
+                                    number_tolerance, date_tolerance, max_differences,
+                                    first_datemode, second_datemode)
+            if changed:
+                diff.changed_rows += 1
+            else:
+                diff.equal_rows += 1
+        diff.removed_rows.extend(range(first_start + paired, first_end))
+        diff.added_rows.extend(range(second_start + paired, second_end))
+    LOGGER.debug('Compared %d and %d rows: %d changed, %d removed, %d added', diff.first_rows, diff.second_rows,
+                 diff.changed_rows, len(diff.removed_rows), len(diff.added_rows))
+    return diff
+
+
+def _compare_rows(diff, first_rowx, first_row, second_rowx, second_row, number_tolerance, date_tolerance,
+                  max_differences, first_datemode, second_datemode):
+    changed = False
+    width = max(len(first_row[0]), len(second_row[0]))
+    for colx in range(width):
+        first_cell = (first_row[0][colx], first_row[1][colx]) if colx < len(first_row[0]) else (XL_CELL_EMPTY, '')
+        second_cell = (second_row[0][colx], second_row[1][colx]) if colx < len(second_row[0]) else (XL_CELL_EMPTY, '')
+        if _cells_equal(first_cell, second_cell, number_tolerance, date_tolerance):
+            continue
+        changed = True
+        diff.changed_cells += 1
+        if len(diff.cells) < max_differences:
+            diff.cells.append((cellname(first_rowx, colx), cellname(second_rowx, colx),
+                               _report_value(first_cell[0], first_cell[1], first_datemode),
+                               _report_value(second_cell[0], second_cell[1], second_datemode)))
+    return changed
+
+
+def compare_workbooks(first, second, number_tolerance=0, date_tolerance=0, max_differences=DEFAULT_MAX_DIFFERENCES):
+    """
+    Compares the sheets with the same name of two workbooks with the xlrd book API and returns a dictionary of
+    `equal`, `removed_sheets`, `added_sheets` and the summary of each common sheet in `sheets`.
+    """
+    first_names, second_names = first.sheet_names(), second.sheet_names()
+    sheets = {}
+    for sheet_name in [name for name in first_names if name in second_names]:
+        sheets[sheet_name] = compare_sheets(first.sheet_by_name(sheet_name), second.sheet_by_name(sheet_name),
+                                            number_tolerance, date_tolerance, max_differences,
+                                            first.datemode, second.datemode).to_dict()
+    removed = [name for name in first_names if name not in second_names]
+    added = [name for name in second_names if name not in first_names]
+    return {'equal': not removed and not added and all(sheet['equal'] for sheet in sheets.values()),
+            'removed_sheets': removed, 'added_sheets': added, 'sheets': sheets}
@@ -0,0 +1,102 @@
+import logging
+
+from ExcelRobot.utils import DataType
+from xlrd.xldate import xldate_as_datetime
+
+LOGGER = logging.getLogger(__name__)
+
+_CONVERTERS = {}
+
+
+def identity(value):
+    return value
+
+
+class CellConverter(object):
+    """
+    Conversion of the values of one cell type to one requested type, resolved once.
+
+    `convert` converts one value, `convert_all` a list of values. Dates are computed once per distinct value of a
+    list, since columns of dates often repeat the same days.
+    """
+
+    __slots__ = ('convert', 'convert_all')
+
+    def __init__(self, convert, memoize=False):
+        self.convert = convert
+        if convert is identity:
+            self.convert_all = list
+        elif memoize:
+            self.convert_all = self._memoized
+        else:
+            self.convert_all = lambda values: [convert(value) for value in values]
+
+    def _memoized(self, values):
+        converted = {}
+        convert = self.convert
+        result = []
+        for value in values:
+            item = converted.get(value)
+            if item is None:
+                item = converted[value] = convert(value)
+            result.append(item)
+        return result
+
+    def __call__(self, value):
+        return self.convert(value)
+
+
+def get_converter(ctype, gtype, use_format, date_format, number_format, bool_format):
+    """
+    Returns the `CellConverter` of the values of the cell type `ctype` to the requested type `gtype`.
+
+    Converters are cached by cell type, requested type, `use_format` and formats, so the dispatch on types and the
+    resolution of formats happen once instead of once per cell.
+    """
+    key = (ctype, gtype, bool(use_format), date_format.key, number_format.key, bool_format.key)
+    converter = _CONVERTERS.get(key)
+    if converter is None:
+        converter = _CONVERTERS[key] = _compile(ctype, gtype, use_format, date_format, number_format, bool_format)
+    return converter
+
+
+def _compile(ctype, gtype, use_format, date_format, number_format, bool_format):
+    LOGGER.debug('Compile converter of Cell Type: %s - Given Type: %s - Use Format: %s', ctype, gtype, use_format)
+    if DataType.is_date(ctype):
+        if gtype and not DataType.is_date(gtype):
+            raise ValueError('Cell type does not match with given data type')
+        return CellConverter(_compile_date(gtype, use_format, date_format), memoize=True)
+    if DataType.is_number(ctype):
+        if gtype and not DataType.is_number(gtype):
+            raise ValueError('Cell type does not match with given data type')
+        if not use_format:
+            return CellConverter(identity)
+        spec = number_format.spec
+        return CellConverter(lambda value: format(value, spec))
+    if DataType.is_bool(ctype):
+        if gtype and not DataType.is_bool(gtype):
+            raise ValueError('Cell type does not match with given data type')
+        if not use_format:
+            return CellConverter(identity)
+        true, false = bool_format.true, bool_format.false
+        return CellConverter(lambda value: true if value else false)
+    return CellConverter(identity)
+
+
+def _compile_date(gtype, use_format, date_format):
+    datemode = date_format.datemode
+    if use_format:
+        py_format = date_format.get_py_format(gtype)
+        min_year = 1904 if datemode else 1900
+
+        def convert(value):
+            value = xldate_as_datetime(value, datemode)
+            if value.year < min_year:
+                value = value.replace(year=min_year)
+            return value.strftime(py_format)
+        return convert
+    if DataType.DATE == gtype:
+        return lambda value: xldate_as_datetime(value, datemode).date()
+    if DataType.TIME == gtype:
+        return lambda value: xldate_as_datetime(value, datemode).time()
+    return lambda value: xldate_as_datetime(value, datemode)
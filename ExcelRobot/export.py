@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import logging
+import os
+from datetime import date, time
+
+from ExcelRobot.metrics import METRICS
+from ExcelRobot.utils import del_file, is_file, replace_file, temp_file_beside
+
+LOGGER = logging.getLogger(__name__)
+
+
+def json_default(value):
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _export(file_path, ext, encoding, write_rows):
+    """
+    Writes the file through `write_rows(handle)` to a temporary file that atomically replaces `file_path`, and
+    returns the number of written rows.
+    """
+    temp_path = temp_file_beside(file_path, ext=ext)
+    LOGGER.debug('Export to %s via %s', file_path, temp_path)
+    try:
+        with io.open(temp_path, 'w', encoding=encoding, newline='') as handle:
+            count = write_rows(handle)
+        replace_file(temp_path, file_path)
+        if METRICS.enabled:
+            METRICS.count('bytes_exported', os.path.getsize(file_path))
+    finally:
+        if is_file(temp_path):
+            del_file(temp_path)
+    return count
+
+
+def export_csv(file_path, rows, header=None, delimiter=',', encoding='utf-8'):
+    """
+    Writes the rows, after the header if given, to a CSV file one by one.
+    """
+    def write_rows(handle):
+        writer = csv.writer(handle, delimiter=delimiter)
+        if header is not None:
+            writer.writerow(header)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+    return _export(file_path, 'csv', encoding, write_rows)
+
+
+def export_jsonl(file_path, rows, header=None, encoding='utf-8'):
+    """
+    Writes the rows to a JSON Lines file one by one, as objects keyed by the header if given, else as arrays.
+    """
+    def write_rows(handle):
+        keys = [str(key) for key in header] if header is not None else None
+        count = 0
+        for row in rows:
+            record = dict(zip(keys, row)) if keys is not None else row
+            handle.write(json.dumps(record, default=json_default, ensure_ascii=False) + '\n')
+            count += 1
+        return count
+    return _export(file_path, 'jsonl', encoding, write_rows)
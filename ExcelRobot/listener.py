@@ -0,0 +1,65 @@
+import json
+import logging
+
+from ExcelRobot.metrics import METRICS
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _diff(before, after):
+    """
+    Returns the entries of `after` that changed since `before`, for counters as well as `{count, seconds}` timers.
+    """
+    delta = {}
+    for name, value in after.items():
+        previous = before.get(name)
+        if isinstance(value, dict):
+            previous = previous or {'count': 0, 'seconds': 0.0}
+            if value['count'] != previous['count']:
+                delta[name] = {'count': value['count'] - previous['count'],
+                               'seconds': round(value['seconds'] - previous['seconds'], 6)}
+        elif value != (previous or 0):
+            delta[name] = value - (previous or 0)
+    return delta
+
+
+class ExcelMetricsListener(object):
+    """
+    Robot Framework listener that enables the Excel metrics, times the keywords of the library and summarizes the
+    metrics per suite. The summaries are returned by `Get Excel Metrics` and, if `output` is given, saved to this JSON
+    file at the end of the execution.
+
+    Example:
+        | robot --listener ExcelRobot.listener.ExcelMetricsListener:excel-metrics.json tests
+    """
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, output=None, library='ExcelRobot'):
+        self.output = output
+        self.library = library
+        self._suites = []
+        METRICS.enabled = True
+
+    def start_suite(self, name, attrs):
+        snapshot = METRICS.snapshot()
+        self._suites.append((snapshot['keywords'], snapshot['counters'], snapshot['timers']))
+
+    def end_keyword(self, name, attrs):
+        if attrs.get('libname') == self.library:
+            METRICS.record_keyword(attrs['kwname'], attrs['elapsedtime'] / 1000.0)
+
+    def end_suite(self, name, attrs):
+        keywords, counters, timers = self._suites.pop()
+        snapshot = METRICS.snapshot()
+        keywords = _diff(keywords, snapshot['keywords'])
+        METRICS.suites[attrs['longname']] = {
+            'keywords': dict(sorted(keywords.items(), key=lambda item: -item[1]['seconds'])),
+            'counters': _diff(counters, snapshot['counters']),
+            'timers': _diff(timers, snapshot['timers'])}
+
+    def close(self):
+        if self.output:
+            LOGGER.info('Save Excel metrics to %s', self.output)
+            with open(self.output, 'w') as handle:
+                json.dump(METRICS.snapshot(), handle, indent=2)
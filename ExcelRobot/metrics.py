@@ -0,0 +1,91 @@
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Metrics(object):
+    """
+    Process-wide counters and timers of the reader and writer internals, and timings of the keywords.
+
+    Everything is a no-op until `enabled` is set: instrumented code only checks this flag, so metrics cost one
+    attribute lookup per call when disabled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.timers = {}
+            self.keywords = {}
+            self.suites = OrderedDict()
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record(self, name, seconds, table=None):
+        table = self.timers if table is None else table
+        with self._lock:
+            entry = table.get(name)
+            if entry is None:
+                entry = table[name] = {'count': 0, 'seconds': 0.0}
+            entry['count'] += 1
+            entry['seconds'] += seconds
+
+    def record_keyword(self, name, seconds):
+        self.record(name, seconds, self.keywords)
+
+    def snapshot(self):
+        """
+        Returns a copy of the counters, the timers, the keyword timings and the per suite summaries.
+        """
+        with self._lock:
+            return {'enabled': self.enabled,
+                    'counters': dict(self.counters),
+                    'timers': dict((name, dict(entry)) for name, entry in self.timers.items()),
+                    'keywords': dict((name, dict(entry)) for name, entry in self.keywords.items()),
+                    'suites': OrderedDict((name, summary) for name, summary in self.suites.items())}
+
+
+METRICS = Metrics()
+
+
+def timed(name):
+    """
+    Decorates a function to record its duration in the timer `name` when metrics are enabled.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return timed_call(name, func, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, value=1):
+    """
+    Adds `value` to the counter `name` when metrics are enabled.
+    """
+    if METRICS.enabled:
+        METRICS.count(name, value)
+
+
+def timed_call(name, func, *args, **kwargs):
+    """
+    Calls `func` with the arguments and records its duration in the timer `name` when metrics are enabled.
+    """
+    if not METRICS.enabled:
+        return func(*args, **kwargs)
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        METRICS.record(name, time.perf_counter() - start)
@@ -0,0 +1,66 @@
+import glob
+import logging
+import os
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_workers(workers):
+    """
+    Returns the number of worker processes, `0` or `None` meaning one per CPU.
+    """
+    workers = int(workers or 0)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def map_in_processes(func, items, workers=1):
+    """
+    Applies `func` to each item in a pool of `workers` processes and returns the results in the order of `items`.
+    With a single worker or item, `func` runs in the current process.
+    """
+    items = list(items)
+    workers = min(get_workers(workers), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    LOGGER.debug('Run %s tasks in %s processes', len(items), workers)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def read_sheet_values(task):
+    """
+    Returns the values of a sheet, as `ExcelReader.get_sheet_values` with the sheet name first.
+    `task` is `(file_path, mode, sheet_name, include_empty_cells)`.
+    """
+    from ExcelRobot.reader import ExcelReader
+    file_path, mode, sheet_name, include_empty_cells = task
+    reader = ExcelReader(file_path, mode=mode)
+    try:
+        return [sheet_name] + reader.get_sheet_values(sheet_name, include_empty_cells)
+    finally:
+        reader.close()
+
+
+def read_workbook_values(task):
+    """
+    Returns the values of each sheet of a file, as `ExcelReader.get_workbook_values`.
+    `task` is `(file_path, mode, include_empty_cells)`.
+    """
+    from ExcelRobot.reader import ExcelReader
+    file_path, mode, include_empty_cells = task
+    reader = ExcelReader(file_path, mode=mode)
+    try:
+        return reader.get_workbook_values(include_empty_cells)
+    finally:
+        reader.close()
+
+
+def find_files(pattern):
+    """
+    Returns the Excel files matching the glob pattern in natural order.
+    """
+    files = [file_path for file_path in glob.glob(pattern, recursive=True)
+             if os.path.isfile(file_path) and file_path.endswith(('.xls', '.xlsx'))]
+    import natsort
+    return natsort.natsorted(files)
@@ -1,32 +1,137 @@
+import io
+import itertools
 import logging
 from operator import itemgetter
 
-import natsort
+from ExcelRobot.cache import SHEET_RESIDENCY, WORKBOOK_CACHE
+from ExcelRobot.compare import DEFAULT_MAX_DIFFERENCES, compare_sheets, compare_workbooks
+from ExcelRobot.converters import get_converter
+from ExcelRobot.export import export_csv, export_jsonl
+from ExcelRobot.metrics import METRICS, count, timed, timed_call
+from ExcelRobot.parallel import map_in_processes, read_sheet_values
+from ExcelRobot.reference import parse_cell, parse_range
+from ExcelRobot.search import LITERAL, compile_matcher, find_cells
+from ExcelRobot.streaming import StreamingBook
 from ExcelRobot.utils import (BoolFormat, DataType, DateFormat, NumberFormat,
-                              excel_name2coord, get_file_path, is_file)
+                              get_file_path, is_file)
 from six import PY2
-from xlrd import cellname, open_workbook, xldate
+from xlrd import cellname, open_workbook
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MODE = 'default'
+STREAMING_MODE = 'streaming'
+DEFAULT_PAGE_SIZE = 1000
+ZIP_SIGNATURE = b'PK\x03\x04'
+
+_CURSOR_IDS = itertools.count(1)
+
+
+def index_key(value):
+    """
+    Returns the text form of a cell value used to look it up, so `57`, `57.0` and `'57'` are the same key.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return value if isinstance(value, str) else str(value)
+
+
+def natsorted_items(data):
+    """
+    Returns the items of the dictionary sorted by natural order of the keys, so `A2` comes before `A10`.
+    """
+    import natsort
+    return natsort.natsorted(data.items(), key=itemgetter(0))
+
+
+def filled_cells(types, values):
+    """
+    Yields `(index, value)` of the cells that are not empty, selected by their types so empty cells are skipped
+    without being visited one by one. Falsy values, such as blank text, are skipped as well.
+    """
+    for index in itertools.compress(itertools.count(), types):
+        value = values[index]
+        if value:
+            yield index, value
+
+
+def count_cells(rows, name='cells_read'):
+    """
+    Counts the cells of the rows when metrics are enabled.
+    """
+    if METRICS.enabled:
+        METRICS.count(name, sum(len(row) for row in rows))
+
+
+class RowCursor(object):
+    """
+    Position in the rows of a sheet, which are read and converted a page at a time when fetched.
+    """
+
+    def __init__(self, sheet_name, rows, start_row=0):
+        self.sheet_name = sheet_name
+        self.position = start_row
+        self._rows = rows
+
+    def fetch(self, size=DEFAULT_PAGE_SIZE):
+        """
+        Returns the next `size` rows, or an empty list when all rows have been fetched.
+        """
+        page = list(itertools.islice(self._rows, size))
+        self.position += len(page)
+        return page
+
+    def close(self):
+        self._rows.close()
+
 
 class ExcelReader(object):
 
-    def __init__(self, file_path, date_format=DateFormat(), number_format=NumberFormat(), bool_format=BoolFormat()):
-        self.file_path = get_file_path(file_path)
+    def __init__(self, file_path, date_format=DateFormat(), number_format=NumberFormat(), bool_format=BoolFormat(),
+                 mode=DEFAULT_MODE, file_contents=None, use_mmap=True):
+        """
+        Opens the Excel file at `file_path`, or the workbook in `file_contents` bytes, in which case `file_path` is
+        not used. xls files are memory-mapped unless `use_mmap` is `False`.
+        """
+        if file_contents is not None:
+            if not isinstance(file_contents, (bytes, bytearray, memoryview)):
+                raise ValueError('Excel content must be bytes')
+            if not file_contents:
+                raise ValueError('Excel content is empty')
+            file_contents = bytes(file_contents)
+        self.file_contents = file_contents
+        self.use_mmap = bool(use_mmap)
+        self.file_path = get_file_path(file_path) if file_contents is None else file_path
+        self.mode = (mode or DEFAULT_MODE).lower()
+        if self.mode not in (DEFAULT_MODE, STREAMING_MODE):
+            raise ValueError('Invalid mode: ' + mode + '. Only support: ' + DEFAULT_MODE + ', ' + STREAMING_MODE)
+        if self.is_streaming and self.is_xls:
+            raise ValueError('Streaming mode only supports xlsx file')
+        self.date_format = date_format
+        self.number_format = number_format
+        self.bool_format = bool_format
+        self._indexes = {}
+        self._cursors = {}
+        if file_contents is not None:
+            LOGGER.info('Opening %s bytes of %s file', len(file_contents), self.extension)
+            self._workbook = self._load_workbook()
+            return
         LOGGER.info('Opening file at %s', self.file_path)
         if not self.file_path or not is_file(self.file_path):
             self._workbook = None
             raise IOError('Excel file is not found') if PY2 else FileNotFoundError('Excel file is not found')
-        self._workbook = open_workbook(self.file_path, formatting_info=self.is_xls, on_demand=True)
-        self.date_format = date_format
-        self.number_format = number_format
-        self.bool_format = bool_format
+        self._workbook = self._load_workbook()
 
     @property
     def is_xls(self):
+        if self.file_contents is not None:
+            return not self.file_contents.startswith(ZIP_SIGNATURE)
         return not self.file_path.endswith('.xlsx')
 
+    @property
+    def is_streaming(self):
+        return self.mode == STREAMING_MODE
+
     @property
     def extension(self):
         return 'xls' if self.is_xls else 'xlsx'
@@ -34,11 +139,39 @@ class ExcelReader(object):
     @property
     def workbook(self):
         if not self._workbook:
-            self._workbook = open_workbook(self.file_path, formatting_info=self.is_xls, on_demand=True)
+            self._workbook = self._load_workbook()
         return self._workbook
 
+    def _load_workbook(self):
+        self._indexes = {}
+        if self.file_contents is not None:
+            # Workbooks in memory are not cached, they have no path to tell whether they changed
+            if self.is_streaming:
+                return StreamingBook(io.BytesIO(self.file_contents))
+            return self._open_workbook(None)
+        if self.is_streaming:
+            return StreamingBook(self.file_path)
+        return WORKBOOK_CACHE.get(self.file_path, self._open_workbook)
+
+    @timed('parse')
+    def _open_workbook(self, file_path):
+        return open_workbook(file_path, file_contents=self.file_contents, formatting_info=self.is_xls, on_demand=True,
+                             use_mmap=self.use_mmap)
+
+    def close(self):
+        """
+        Releases the workbook. A cached workbook stays in the workbook cache to be reused.
+        """
+        for cursor in self._cursors.values():
+            cursor.close()
+        self._cursors = {}
+        if self._workbook is not None and self.is_streaming:
+            self._workbook.release_resources()
+        self._workbook = None
+        self._indexes = {}
+
     def _get_sheet(self, sheet_name):
-        return self.workbook.sheet_by_name(sheet_name)
+        return SHEET_RESIDENCY.sheet_by_name(self.workbook, sheet_name)
 
     def _get_cell_type(self, sheet_name, column, row):
         return self._get_sheet(sheet_name).cell_type(int(row), int(column))
@@ -72,48 +205,101 @@ class ExcelReader(object):
         Returns the specific column values of the sheet name specified.
         """
         sheet = self._get_sheet(sheet_name)
+        column = int(column)
         data = {}
-        for row_index in range(sheet.nrows):
-            cell = cellname(row_index, int(column))
-            value = sheet.cell(row_index, int(column)).value
-            data[cell] = value
-        if not include_empty_cells:
-            data = dict([(k, v) for (k, v) in data.items() if v])
-        return natsort.natsorted(data.items(), key=itemgetter(0))
+        if include_empty_cells:
+            for row_index, value in enumerate(sheet.col_values(column)):
+                data[cellname(row_index, column)] = value
+        else:
+            for row_index, value in filled_cells(sheet.col_types(column), sheet.col_values(column)):
+                data[cellname(row_index, column)] = value
+        count('cells_read', len(data))
+        return natsorted_items(data)
 
     def get_row_values(self, sheet_name, row, include_empty_cells=True):
         """
         Returns the specific row values of the sheet name specified.
         """
         sheet = self._get_sheet(sheet_name)
+        row = int(row)
         data = {}
-        for col_index in range(sheet.ncols):
-            cell = cellname(int(row), col_index)
-            value = sheet.cell(int(row), col_index).value
-            data[cell] = value
-        if not include_empty_cells:
-            data = dict([(k, v) for (k, v) in data.items() if v])
-        return natsort.natsorted(data.items(), key=itemgetter(0))
+        if include_empty_cells:
+            for col_index, value in enumerate(sheet.row_values(row)):
+                data[cellname(row, col_index)] = value
+        else:
+            for col_index, value in filled_cells(sheet.row_types(row), sheet.row_values(row)):
+                data[cellname(row, col_index)] = value
+        count('cells_read', len(data))
+        return natsorted_items(data)
 
     def get_sheet_values(self, sheet_name, include_empty_cells=True):
         """
         Returns the values from the sheet name specified.
         """
-        sheet = self._get_sheet(sheet_name)
         data = {}
-        for row_index in range(sheet.nrows):
-            for col_index in range(sheet.ncols):
-                cell = cellname(row_index, col_index)
-                value = sheet.cell(row_index, col_index).value
-                data[cell] = value
-        if not include_empty_cells:
-            data = dict([(k, v) for (k, v) in data.items() if v])
-        return natsort.natsorted(data.items(), key=itemgetter(0))
+        if include_empty_cells:
+            sheet = self._get_sheet(sheet_name)
+            for row_index in range(sheet.nrows):
+                for col_index, value in enumerate(sheet.row_values(row_index)):
+                    data[cellname(row_index, col_index)] = value
+        else:
+            for _, row_index, _, types, values in self._scan_rows([sheet_name]):
+                for col_index, value in filled_cells(types, values):
+                    data[cellname(row_index, col_index)] = value
+        count('cells_read', len(data))
+        return natsorted_items(data)
+
+    def get_sheet_values_as_table(self, sheet_name, header_row=None):
+        """
+        Returns the values from the sheet name specified as a list of rows.
+        If `header_row` is given, rows below it are returned as records keyed by the header values.
+        """
+        sheet = self._get_sheet(sheet_name)
+        start = 0 if header_row is None else int(header_row) + 1
+        rows = [sheet.row_values(row_index) for row_index in range(start, sheet.nrows)]
+        count_cells(rows)
+        return self._to_records(sheet.row_values(int(header_row)), rows) if header_row is not None else rows
+
+    def get_row_values_as_table(self, sheet_name, start_row, end_row=None, header_row=None):
+        """
+        Returns the values of the rows from `start_row` to `end_row` (inclusive) as a list of rows.
+        If `header_row` is given, rows are returned as records keyed by the header values.
+        """
+        sheet = self._get_sheet(sheet_name)
+        end = sheet.nrows if end_row is None else min(int(end_row) + 1, sheet.nrows)
+        rows = [sheet.row_values(row_index) for row_index in range(int(start_row), end)
+                if header_row is None or row_index != int(header_row)]
+        count_cells(rows)
+        return self._to_records(sheet.row_values(int(header_row)), rows) if header_row is not None else rows
+
+    def get_column_values_as_table(self, sheet_name, columns, header_row=None):
+        """
+        Returns the values of the given columns as a list of rows, in the order of `columns`.
+        If `header_row` is given, rows below it are returned as records keyed by the header values.
+        """
+        sheet = self._get_sheet(sheet_name)
+        columns = [int(column) for column in (columns.split(',') if isinstance(columns, str) else columns)]
+        start = 0 if header_row is None else int(header_row)
+        rows = [list(row) for row in zip(*[sheet.col_values(column, start) for column in columns])]
+        count_cells(rows)
+        return self._to_records(rows[0], rows[1:]) if header_row is not None and rows else rows
 
-    def get_workbook_values(self, include_empty_cells=True):
+    @staticmethod
+    def _to_records(header, rows):
+        return [dict(zip(header, row)) for row in rows]
+
+    def get_workbook_values(self, include_empty_cells=True, workers=1):
         """
         Returns the values from each sheet of the current workbook.
+        With more than one `workers`, sheets of an xls file are read from the file in a pool of processes, `0` meaning
+        one per CPU. Each worker only parses its sheet, since xls sheets are loaded on demand, whereas each worker would
+        parse the whole workbook of an xlsx file, so xlsx files and workbooks opened from bytes are always read in the
+        current process.
         """
+        if int(workers) != 1 and self.is_xls and self.file_contents is None:
+            tasks = [(self.file_path, self.mode, sheet_name, include_empty_cells)
+                     for sheet_name in self.workbook.sheet_names()]
+            return map_in_processes(read_sheet_values, tasks, workers)
         sheet_data = []
         workbook_data = []
         for sheet_name in self.workbook.sheet_names():
@@ -126,7 +312,7 @@ class ExcelReader(object):
         """
         Uses the cell name to return the data from that cell.
         """
-        col, row = excel_name2coord(cell_name)
+        col, row = parse_cell(cell_name)
         return self.read_cell_data(sheet_name, col, row, data_type, use_format)
 
     def read_cell_data(self, sheet_name, column, row, data_type=None, use_format=True):
@@ -145,26 +331,209 @@ class ExcelReader(object):
         LOGGER.debug('Given Type: %s', gtype)
         LOGGER.debug('Cell Type: %s', ctype)
         LOGGER.debug('Cell Value: %s', value)
-        if DataType.is_date(ctype):
-            if gtype and not DataType.is_date(gtype):
-                raise ValueError('Cell type does not match with given data type')
-            date_value = xldate.xldate_as_datetime(value, self.date_format.datemode)
-            if use_format:
-                return self.date_format.format(gtype, date_value)
-            elif DataType.DATE == gtype:
-                return date_value.date()
-            elif DataType.TIME == gtype:
-                return date_value.time()
-            return date_value
-        if DataType.is_number(ctype):
-            if gtype and not DataType.is_number(gtype):
-                raise ValueError('Cell type does not match with given data type')
-            return self.number_format.format(gtype, value) if use_format else value
-        if DataType.is_bool(ctype):
-            if gtype and not DataType.is_bool(gtype):
-                raise ValueError('Cell type does not match with given data type')
-            return self.bool_format.format(value) if use_format else value
-        return value
+        count('cells_read')
+        return timed_call('convert', self._cell_converter(ctype, gtype, use_format).convert, value)
+
+    def read_range(self, sheet_name, range_name, data_type=None, use_format=True):
+        """
+        Uses the range name to return the data of the cells as a list of rows.
+
+        The conversion is resolved once per column and cell type instead of once per cell, and columns of a single
+        cell type are converted as a whole.
+        """
+        cell_range = parse_range(range_name)
+        sheet = self._get_sheet(cell_range.sheet_name or sheet_name)
+        first_col, first_row, last_col, last_row = cell_range.resolve(sheet.nrows, sheet.ncols)
+        gtype = DataType.parse_type(data_type)
+        rows = range(first_row, last_row + 1)
+        values = [sheet.row_values(row_index, first_col, last_col + 1) for row_index in rows]
+        types = [sheet.row_types(row_index, first_col, last_col + 1) for row_index in rows]
+        count_cells(values)
+        return self._convert_read_rows(values, types, gtype, use_format)
+
+    @timed('convert')
+    def _convert_read_rows(self, values, types, gtype, use_format):
+        columns = []
+        for col_values, col_types in zip(zip(*values), zip(*types)):
+            ctypes = set(col_types)
+            if len(ctypes) == 1:
+                converter = self._cell_converter(DataType.parse_type_by_value(ctypes.pop()), gtype, use_format)
+                columns.append(converter.convert_all(col_values))
+                continue
+            converters = {}
+            for ctype in ctypes:
+                converters[ctype] = self._cell_converter(DataType.parse_type_by_value(ctype), gtype, use_format).convert
+            columns.append([converters[ctype](value) for ctype, value in zip(col_types, col_values)])
+        return [list(row) for row in zip(*columns)]
+
+    def iter_rows(self, sheet_name, start_row=0, use_format=True):
+        """
+        Yields the converted values of each row from `start_row`, reading one row at a time.
+        """
+        sheet = self._get_sheet(sheet_name)
+        converters = {}
+        if hasattr(sheet, 'iter_rows'):
+            rows = sheet.iter_rows(int(start_row))
+        else:
+            rows = ((sheet.row_types(row_index), sheet.row_values(row_index))
+                    for row_index in range(int(start_row), sheet.nrows))
+        for types, values in rows:
+            row = []
+            for ctype, value in zip(types, values):
+                converter = converters.get(ctype)
+                if converter is None:
+                    converter = converters[ctype] = self._cell_converter(DataType.parse_type_by_value(ctype), None,
+                                                                         use_format).convert
+                row.append(converter(value))
+            count('cells_read', len(row))
+            yield row
+
+    def open_row_cursor(self, sheet_name, start_row=0, use_format=True):
+        """
+        Opens a cursor on the rows of the sheet from `start_row` and returns its id.
+        Rows are read from the sheet only when fetched, so only one page of rows is held at a time.
+        """
+        self._get_sheet(sheet_name)
+        cursor_id = next(_CURSOR_IDS)
+        self._cursors[cursor_id] = RowCursor(sheet_name, self.iter_rows(sheet_name, start_row, use_format),
+                                             int(start_row))
+        LOGGER.debug('Open row cursor %s of Sheet: %s - Start Row: %s', cursor_id, sheet_name, start_row)
+        return cursor_id
+
+    def fetch_rows(self, cursor_id, size=DEFAULT_PAGE_SIZE):
+        """
+        Returns the next `size` converted rows of the cursor, or an empty list when all rows have been fetched.
+        """
+        size = int(size)
+        if size <= 0:
+            raise ValueError('Page size must be positive: ' + str(size))
+        return self._get_cursor(cursor_id).fetch(size)
+
+    def close_row_cursor(self, cursor_id):
+        """
+        Closes the cursor and returns the index of the row it would have fetched next.
+        """
+        cursor = self._get_cursor(cursor_id)
+        del self._cursors[int(cursor_id)]
+        cursor.close()
+        return cursor.position
+
+    def _get_cursor(self, cursor_id):
+        cursor = self._cursors.get(int(cursor_id))
+        if cursor is None:
+            raise ValueError('No row cursor is opened with id: ' + str(cursor_id))
+        return cursor
+
+    def export_sheet_to_csv(self, sheet_name, file_path, delimiter=',', header_row=None, use_format=True,
+                            encoding='utf-8'):
+        """
+        Writes the rows of the sheet to a CSV file, from the row after `header_row` preceded by the header if given.
+        Returns the number of exported rows.
+        """
+        header, start = self._export_header(sheet_name, header_row, use_format)
+        return export_csv(file_path, self.iter_rows(sheet_name, start, use_format), header, delimiter, encoding)
+
+    def export_sheet_to_jsonl(self, sheet_name, file_path, header_row=None, use_format=True, encoding='utf-8'):
+        """
+        Writes the rows of the sheet to a JSON Lines file, as objects keyed by the values of `header_row` if given,
+        else as arrays. Returns the number of exported rows.
+        """
+        header, start = self._export_header(sheet_name, header_row, use_format)
+        return export_jsonl(file_path, self.iter_rows(sheet_name, start, use_format), header, encoding)
+
+    def _export_header(self, sheet_name, header_row, use_format):
+        if header_row is None:
+            return None, 0
+        header = next(self.iter_rows(sheet_name, int(header_row), use_format), None)
+        return header, int(header_row) + 1
+
+    def _cell_converter(self, ctype, gtype, use_format):
+        """
+        Returns the cached converter of the values of the given cell type to the given data type.
+        """
+        return get_converter(ctype, gtype, use_format, self.date_format, self.number_format, self.bool_format)
+
+    def find_row_by_value(self, sheet_name, column, value):
+        """
+        Returns the first row index of which the column has the given value, or `None` if not found.
+        """
+        rows = self.find_rows_by_values(sheet_name, [column], [value])
+        return rows[0] if rows else None
+
+    def find_rows_by_values(self, sheet_name, columns, values):
+        """
+        Returns the row indexes of which the columns have the given values.
+
+        The lookup uses a hash index per sheet and columns, which is built on first use.
+        """
+        columns = tuple(int(column) for column in (columns.split(',') if isinstance(columns, str) else columns))
+        values = values.split(',') if isinstance(values, str) else values
+        if len(columns) != len(values):
+            raise ValueError('Number of columns and values does not match')
+        index = self._get_index(sheet_name, columns)
+        return list(index.get(tuple(index_key(value) for value in values), []))
+
+    def _get_index(self, sheet_name, columns):
+        index = self._indexes.get((sheet_name, columns))
+        if index is None:
+            LOGGER.debug('Build index of Sheet: %s - Columns: %s', sheet_name, columns)
+            sheet = self._get_sheet(sheet_name)
+            index = {}
+            for row_index, key in enumerate(zip(*[sheet.col_values(column) for column in columns])):
+                index.setdefault(tuple(index_key(value) for value in key), []).append(row_index)
+            self._indexes[(sheet_name, columns)] = index
+        return index
+
+    def find_cells_matching(self, pattern, mode=LITERAL, sheet_name=None, range_name=None, max_matches=0):
+        """
+        Returns the references, such as `Sheet1!B3`, of the text cells matching the pattern in the sheet, the range
+        or the whole workbook by default. Stops after `max_matches` references unless `0`.
+        """
+        cell_range = parse_range(range_name) if range_name else None
+        if cell_range and cell_range.sheet_name:
+            sheet_name = cell_range.sheet_name
+        sheet_names = [sheet_name] if sheet_name else self.workbook.sheet_names()
+        return find_cells(self._scan_rows(sheet_names, cell_range), compile_matcher(pattern, mode), max_matches)
+
+    def _scan_rows(self, sheet_names, cell_range=None):
+        """
+        Yields `(sheet name, row index, first column index, types, values)` of each row of the sheets, restricted to
+        the range if given.
+        """
+        for sheet_name in sheet_names:
+            sheet = self._get_sheet(sheet_name)
+            if cell_range:
+                first_col, first_row, last_col, last_row = cell_range.resolve(sheet.nrows, sheet.ncols)
+            else:
+                first_col, first_row, last_col, last_row = 0, 0, sheet.ncols - 1, sheet.nrows - 1
+            if hasattr(sheet, 'iter_rows'):
+                rows = ((types[first_col:last_col + 1], values[first_col:last_col + 1])
+                        for types, values in sheet.iter_rows(first_row, last_row + 1))
+            else:
+                rows = ((sheet.row_types(row_index, first_col, last_col + 1),
+                         sheet.row_values(row_index, first_col, last_col + 1))
+                        for row_index in range(first_row, last_row + 1))
+            for row_index, (types, values) in enumerate(rows, first_row):
+                yield sheet_name, row_index, first_col, types, values
+
+    def compare_sheet(self, sheet_name, other, other_sheet_name=None, number_tolerance=0, date_tolerance=0,
+                      max_differences=DEFAULT_MAX_DIFFERENCES):
+        """
+        Compares the sheet with the sheet of `other` reader, which has the same name by default, and returns a
+        summary of the differences.
+        """
+        diff = compare_sheets(self._get_sheet(sheet_name), other._get_sheet(other_sheet_name or sheet_name),
+                              float(number_tolerance), float(date_tolerance), int(max_differences),
+                              self.workbook.datemode, other.workbook.datemode)
+        return diff.to_dict()
+
+    def compare_workbook(self, other, number_tolerance=0, date_tolerance=0, max_differences=DEFAULT_MAX_DIFFERENCES):
+        """
+        Compares the sheets of the workbook with the sheets of the same name of `other` reader and returns a summary
+        of the differences.
+        """
+        return compare_workbooks(self.workbook, other.workbook, float(number_tolerance), float(date_tolerance),
+                                 int(max_differences))
 
     def check_cell_type(self, sheet_name, column, row, data_type):
         """
@@ -0,0 +1,99 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from xlrd import cellname
+
+CELL_PATTERN = re.compile(r'^\$?([A-Z]{1,3})\$?([1-9]\d*)$')
+COLUMN_PATTERN = re.compile(r'^\$?([A-Z]{1,3})$')
+ROW_PATTERN = re.compile(r'^\$?([1-9]\d*)$')
+SHEET_PATTERN = re.compile(r"^(?:'((?:[^']|'')+)'|([^!]+))!(.+)$")
+SIMPLE_SHEET_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_.]*$')
+
+
+class CellRange(namedtuple('CellRange', 'sheet_name first_col first_row last_col last_row')):
+    """
+    Zero-based and inclusive coordinates of a range. `None` bounds are open: `B:B` has no row bounds and `3:3` has no
+    column bounds.
+    """
+
+    __slots__ = ()
+
+    def resolve(self, nrows, ncols):
+        """
+        Returns `(first_col, first_row, last_col, last_row)` with open bounds clipped to the given sheet size.
+        """
+        return (0 if self.first_col is None else self.first_col,
+                0 if self.first_row is None else self.first_row,
+                ncols - 1 if self.last_col is None else min(self.last_col, ncols - 1),
+                nrows - 1 if self.last_row is None else min(self.last_row, nrows - 1))
+
+
+def column_index(letters):
+    """
+    Converts column letters to zero-based column index: `A` is 0, `AA` is 26.
+    """
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index - 1
+
+
+@lru_cache(maxsize=4096)
+def parse_cell(cell_name):
+    """
+    Parses a cell name such as `B3` or `$B$3` to zero-based `(column, row)`.
+    """
+    match = CELL_PATTERN.match(cell_name.strip().upper())
+    if not match:
+        raise ValueError('Cell name is invalid')
+    return column_index(match.group(1)), int(match.group(2)) - 1
+
+
+def _parse_bound(reference):
+    match = CELL_PATTERN.match(reference)
+    if match:
+        return column_index(match.group(1)), int(match.group(2)) - 1
+    match = COLUMN_PATTERN.match(reference)
+    if match:
+        return column_index(match.group(1)), None
+    match = ROW_PATTERN.match(reference)
+    if match:
+        return None, int(match.group(1)) - 1
+    raise ValueError('Range is invalid: ' + reference)
+
+
+@lru_cache(maxsize=1024)
+def parse_range(reference):
+    """
+    Parses a range such as `A1:D100`, `B:B`, `3:3`, `Sheet1!A1:C9` or a single cell `A1` to a `CellRange`.
+    """
+    sheet_name = None
+    match = SHEET_PATTERN.match(reference.strip())
+    if match:
+        sheet_name = match.group(1).replace("''", "'") if match.group(1) else match.group(2)
+        reference = match.group(3)
+    bounds = reference.strip().upper().split(':')
+    if len(bounds) > 2:
+        raise ValueError('Range is invalid: ' + reference)
+    first_col, first_row = _parse_bound(bounds[0])
+    last_col, last_row = _parse_bound(bounds[-1])
+    if (first_col is None) != (last_col is None) or (first_row is None) != (last_row is None):
+        raise ValueError('Range is invalid: ' + reference)
+    if len(bounds) == 1 and (first_col is None or first_row is None):
+        raise ValueError('Range is invalid: ' + reference)
+    if first_col is not None and last_col < first_col:
+        first_col, last_col = last_col, first_col
+    if first_row is not None and last_row < first_row:
+        first_row, last_row = last_row, first_row
+    return CellRange(sheet_name, first_col, first_row, last_col, last_row)
+
+
+def cell_reference(sheet_name, rowx, colx):
+    """
+    Returns the reference of a cell with its sheet such as `Sheet1!B3`, quoting the sheet name as `'Graph Data'!B3`
+    when needed, which `parse_range` parses back.
+    """
+    if not SIMPLE_SHEET_PATTERN.match(sheet_name):
+        sheet_name = "'" + sheet_name.replace("'", "''") + "'"
+    return sheet_name + '!' + cellname(rowx, colx)
@@ -0,0 +1,61 @@
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ExcelRegistry(object):
+    """
+    Opened Excel handles by alias. A handle keeps its parsed workbook resident until it is closed.
+
+    Registering a handle with the alias of another one closes and replaces the other one.
+    """
+
+    def __init__(self):
+        self._handles = OrderedDict()
+        self.current_alias = None
+
+    def register(self, handle, alias):
+        alias = str(alias)
+        replaced = self._handles.pop(alias, None)
+        if replaced is not None and replaced is not handle:
+            LOGGER.debug('Replace Excel handle: %s', alias)
+            replaced.close()
+        self._handles[alias] = handle
+        self.current_alias = alias
+        return alias
+
+    def get(self, alias):
+        handle = self._handles.get(str(alias))
+        if handle is None:
+            raise ValueError('No Excel file is opened with alias: ' + str(alias))
+        return handle
+
+    def switch(self, alias):
+        handle = self.get(alias)
+        self.current_alias = str(alias)
+        return handle
+
+    def close(self, alias=None):
+        alias = str(alias if alias is not None else self.current_alias)
+        handle = self.get(alias)
+        del self._handles[alias]
+        if self.current_alias == alias:
+            self.current_alias = next(reversed(self._handles), None)
+        handle.close()
+        return handle
+
+    def close_all(self):
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+        self.current_alias = None
+
+    def __contains__(self, handle):
+        return any(value is handle for value in self._handles.values())
+
+    def aliases(self):
+        return list(self._handles)
+
+    def __len__(self):
+        return len(self._handles)
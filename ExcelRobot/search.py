@@ -0,0 +1,56 @@
+import logging
+import re
+
+from ExcelRobot.reference import cell_reference
+from xlrd import XL_CELL_TEXT
+
+LOGGER = logging.getLogger(__name__)
+
+LITERAL = 'literal'
+REGEX = 'regex'
+IGNORE_CASE = 'ignore_case'
+MATCH_MODES = (LITERAL, REGEX, IGNORE_CASE)
+
+
+def compile_matcher(pattern, mode=LITERAL):
+    """
+    Returns a function telling whether a text matches the pattern: contains it in `literal` and `ignore_case`
+    modes, or matches it anywhere in `regex` mode.
+    """
+    mode = (mode or LITERAL).lower()
+    pattern = str(pattern)
+    if mode == LITERAL:
+        return lambda text: pattern in text
+    if mode == IGNORE_CASE:
+        folded = pattern.casefold()
+        return lambda text: folded in text.casefold()
+    if mode == REGEX:
+        search = re.compile(pattern).search
+        return lambda text: search(text) is not None
+    raise ValueError('Invalid match mode: ' + mode + '. Only support: ' + ', '.join(MATCH_MODES))
+
+
+def find_cells(rows, matcher, max_matches=0):
+    """
+    Returns the references of the text cells matching, in the order of `rows`, which are
+    `(sheet name, row index, first column index, types, values)`. Stops after `max_matches` references unless `0`.
+
+    Each distinct text is tested once, so repeated texts, which are stored once in the shared strings of the file,
+    cost a dictionary lookup instead of another match.
+    """
+    max_matches = int(max_matches or 0)
+    tested = {}
+    references = []
+    for sheet_name, rowx, first_colx, types, values in rows:
+        for offset, (ctype, value) in enumerate(zip(types, values)):
+            if ctype != XL_CELL_TEXT:
+                continue
+            matched = tested.get(value)
+            if matched is None:
+                matched = tested[value] = matcher(value)
+            if matched:
+                references.append(cell_reference(sheet_name, rowx, first_colx + offset))
+                if len(references) == max_matches:
+                    return references
+    LOGGER.debug('Tested %s distinct texts, found %s cells', len(tested), len(references))
+    return references
@@ -0,0 +1,188 @@
+import logging
+import numbers
+from datetime import date, datetime, time, timedelta
+
+from xlrd import (XL_CELL_BOOLEAN, XL_CELL_DATE, XL_CELL_EMPTY, XL_CELL_ERROR,
+                  XL_CELL_NUMBER, XL_CELL_TEXT)
+from xlrd.biffh import error_text_from_code
+from xlrd.sheet import Cell
+
+LOGGER = logging.getLogger(__name__)
+
+ERROR_CODES = dict((text, code) for code, text in error_text_from_code.items())
+
+
+def to_xldate(value, datemode=0):
+    """
+    Converts a datetime to Excel serial date, with the 1900 leap year bug for dates before 1900-03-01 as Excel does.
+    """
+    if datemode:
+        epoch = datetime(1904, 1, 1)
+    else:
+        epoch = datetime(1899, 12, 31) if value < datetime(1900, 3, 1) else datetime(1899, 12, 30)
+    delta = value - epoch
+    return delta.days + (delta.seconds + delta.microseconds / 1E6) / 86400
+
+
+def get_datemode(workbook):
+    """
+    Returns the xlrd datemode of an openpyxl workbook: `1` if its dates are based on 1904, else `0`.
+    """
+    epoch = getattr(workbook, 'epoch', getattr(workbook, 'excel_base_date', None))
+    return 1 if epoch is not None and epoch.year == 1904 else 0
+
+
+def to_xlrd_cell(value, data_type, datemode):
+    """
+    Converts an openpyxl cell value to xlrd `(ctype, value)`, so it reads the same as a cell parsed by xlrd.
+    """
+    if value is None:
+        return XL_CELL_EMPTY, ''
+    if isinstance(value, bool):
+        return XL_CELL_BOOLEAN, int(value)
+    if isinstance(value, datetime):
+        return XL_CELL_DATE, to_xldate(value, datemode)
+    if isinstance(value, date):
+        return XL_CELL_DATE, to_xldate(datetime.combine(value, time()), datemode)
+    if isinstance(value, time):
+        return XL_CELL_DATE, (value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1E6) / 86400
+    if isinstance(value, timedelta):
+        return XL_CELL_DATE, value.total_seconds() / 86400
+    if isinstance(value, numbers.Number):
+        return XL_CELL_NUMBER, float(value)
+    if data_type == 'e':
+        return XL_CELL_ERROR, ERROR_CODES.get(value, 0)
+    return XL_CELL_TEXT, value
+
+
+class StreamingSheet(object):
+    """
+    Read-only view of an xlsx worksheet that mimics the row and column API of `xlrd.sheet.Sheet`.
+
+    Rows are served by a forward iterator over openpyxl `read_only` worksheet, so memory stays bounded by one row.
+    Reading a row before the current position restarts the iterator. Random cell access raises `ValueError`.
+
+    The dimension written in the file is ignored, since it may be stale and openpyxl would clip rows to it: the
+    number of rows and columns is counted by scanning the sheet once, on first access.
+    """
+
+    def __init__(self, worksheet, datemode=0):
+        worksheet.reset_dimensions()
+        self.name = worksheet.title
+        self._worksheet = worksheet
+        self._datemode = datemode
+        self._nrows = None
+        self._ncols = None
+        self._rows = None
+        self._rowx = -1
+        self._current = None
+
+    @property
+    def nrows(self):
+        if self._nrows is None:
+            self._compute_dimension()
+        return self._nrows
+
+    @property
+    def ncols(self):
+        if self._ncols is None:
+            self._compute_dimension()
+        return self._ncols
+
+    def _compute_dimension(self):
+        LOGGER.debug('Scanning sheet %s for its dimension', self.name)
+        max_row, max_col = 0, 0
+        for row in self._worksheet.iter_rows(values_only=True):
+            max_row += 1
+            max_col = max(max_col, len(row))
+        self._nrows, self._ncols = max_row, max_col
+
+    def _convert(self, cells):
+        row = [to_xlrd_cell(cell.value, cell.data_type, self._datemode) for cell in cells]
+        row.extend([(XL_CELL_EMPTY, '')] * (self.ncols - len(row)))
+        return row
+
+    def _seek(self, rowx):
+        rowx = int(rowx)
+        if rowx < 0 or rowx >= self.nrows:
+            raise IndexError('Row index out of range')
+        if self._rows is None or rowx < self._rowx:
+            LOGGER.debug('Restart reading sheet %s from row %d', self.name, rowx)
+            self._rows = self._worksheet.iter_rows(min_row=rowx + 1)
+            self._rowx = rowx - 1
+        while self._rowx < rowx:
+            try:
+                self._current = self._convert(next(self._rows))
+            except StopIteration:
+                self._rows = None
+                raise IndexError('Row index out of range')
+            self._rowx += 1
+        return self._current
+
+    def iter_rows(self, start_rowx=0, end_rowx=None):
+        """
+        Yields the `(types, values)` of each row from `start_rowx` to `end_rowx` (exclusive) with a fresh iterator.
+        """
+        end_rowx = self.nrows if end_rowx is None else min(end_rowx, self.nrows)
+        if start_rowx >= end_rowx:
+            return
+        for cells in self._worksheet.iter_rows(min_row=start_rowx + 1, max_row=end_rowx):
+            row = self._convert(cells)
+            yield [ctype for ctype, _ in row], [value for _, value in row]
+
+    def get_rows(self):
+        for types, values in self.iter_rows():
+            yield [Cell(ctype, value) for ctype, value in zip(types, values)]
+
+    def row_values(self, rowx, start_colx=0, end_colx=None):
+        return [value for _, value in self._seek(rowx)[start_colx:end_colx]]
+
+    def row_types(self, rowx, start_colx=0, end_colx=None):
+        return [ctype for ctype, _ in self._seek(rowx)[start_colx:end_colx]]
+
+    def row_len(self, rowx):
+        return self.ncols
+
+    def col_values(self, colx, start_rowx=0, end_rowx=None):
+        return [values[int(colx)] for _, values in self.iter_rows(start_rowx, end_rowx)]
+
+    def col_types(self, colx, start_rowx=0, end_rowx=None):
+        return [types[int(colx)] for types, _ in self.iter_rows(start_rowx, end_rowx)]
+
+    def cell(self, rowx, colx):
+        raise ValueError('Random cell access is not supported in streaming mode. '
+                         'Open the Excel file without `mode=streaming` to use this keyword')
+
+    cell_value = cell_type = cell
+
+
+class StreamingBook(object):
+    """
+    Read-only xlsx workbook backed by openpyxl `read_only` mode, which mimics the API of `xlrd.book.Book`.
+    """
+
+    def __init__(self, file_path):
+        LOGGER.debug('Opening streaming workbook at %s', file_path)
+        import openpyxl
+        self._workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        self.datemode = get_datemode(self._workbook)
+        self._sheets = {}
+
+    @property
+    def nsheets(self):
+        return len(self._workbook.sheetnames)
+
+    def sheet_names(self):
+        return list(self._workbook.sheetnames)
+
+    def sheet_by_name(self, sheet_name):
+        if sheet_name not in self._sheets:
+            self._sheets[sheet_name] = StreamingSheet(self._workbook[sheet_name], self.datemode)
+        return self._sheets[sheet_name]
+
+    def sheet_by_index(self, sheetx):
+        return self.sheet_by_name(self._workbook.sheetnames[sheetx])
+
+    def release_resources(self):
+        self._sheets = {}
+        self._workbook.close()
@@ -1,4 +1,3 @@
-import functools
 import logging
 import numbers
 import os
@@ -11,6 +10,7 @@ from datetime import date, datetime, time
 from enum import Enum
 from random import choice
 
+from ExcelRobot.reference import parse_cell
 from xlrd import (XL_CELL_BLANK, XL_CELL_BOOLEAN, XL_CELL_DATE, XL_CELL_EMPTY,
                   XL_CELL_ERROR, XL_CELL_NUMBER, XL_CELL_TEXT)
 
@@ -41,6 +41,55 @@ def copy_file(src, dest, force=False):
     shutil.copy(src, dest)
 
 
+def temp_file_beside(file_path, ext='txt'):
+    """
+    Creates an empty temporary file in the directory of the given file, so it can replace the file atomically.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix='.' + ext, prefix='.' + path.basename(file_path) + '.',
+                                     dir=path.dirname(path.abspath(file_path)))
+    os.close(fd)
+    return temp_path
+
+
+def replace_file(src, dest, fsync=False, backup=False):
+    """
+    Atomically replaces `dest` by `src`, which must be on the same filesystem.
+
+    With `fsync`, data of `src` and then its directory entry are flushed to disk.
+    With `backup`, the previous `dest` is kept as `dest.bak`.
+    `src` gets the permission bits of `dest`, or the default ones of a new file if `dest` does not exist, since
+    temporary files are only readable by their owner.
+    """
+    if is_file(dest):
+        shutil.copymode(dest, src)
+    else:
+        os.chmod(src, 0o666 & ~_current_umask())
+    if fsync:
+        with open(src, 'rb+') as handle:
+            os.fsync(handle.fileno())
+    if backup and is_file(dest):
+        backup_path = dest + '.bak'
+        if is_file(backup_path):
+            del_file(backup_path)
+        try:
+            os.link(dest, backup_path)
+        except OSError:
+            shutil.copy2(dest, backup_path)
+    os.replace(src, dest)
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        fd = os.open(path.dirname(path.abspath(dest)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
 def get_file_path(file_name):
     """
     Return None if file_name is None
@@ -56,15 +105,7 @@ def get_file_path(file_name):
 
 
 def excel_name2coord(cell_name):
-    matrix = list(filter(lambda x: x.strip(), re.split(r'(\d+)', cell_name.upper())))
-    LOGGER.debug('Matrix: %s', matrix)
-    if len(matrix) != 2 or not re.match(r'[A-Z]+', matrix[0]) or not re.match(r'\d+', matrix[1]):
-        raise ValueError('Cell name is invalid')
-    col = int(functools.reduce(lambda s, a: s * 26 + ord(a) - ord('A') + 1, matrix[0], 0)) - 1
-    row = int(matrix[1]) - 1
-    LOGGER.debug('Col, Row: %d, %d', col, row)
-    return col, row
-
+    return parse_cell(cell_name)
 
 
 class DataType(Enum):
@@ -145,6 +186,10 @@ class DateFormat:
         self.py_datetime_format = self.excel2python_format(self.datetime_format)
         self.datemode = 0  # 0: 1900-based, 1: 1904-based
 
+    @property
+    def key(self):
+        return self.date_format, self.time_format, self.datetime_format, self.datemode
+
     def get_excel_format(self, data_type, value):
         if value and isinstance(value, time) or DataType.TIME == data_type:
             return self.time_format.lower()
@@ -170,7 +215,12 @@ class DateFormat:
 class NumberFormat:
 
     def __init__(self, decimal_sep='.', thousand_sep=',', precision='2'):
-        self.number_format = '{0:' + thousand_sep + decimal_sep + precision + 'f}'
+        self.spec = thousand_sep + decimal_sep + precision + 'f'
+        self.number_format = '{0:' + self.spec + '}'
+
+    @property
+    def key(self):
+        return self.spec
 
     def get_excel_format(self, data_type):
         # TODO: Missing percentage and currency
@@ -190,6 +240,10 @@ class BoolFormat:
         self.true = bool_format.split('/')[0]
         self.false = bool_format.split('/')[1]
 
+    @property
+    def key(self):
+        return self.true, self.false
+
     def format(self, value):
         return self.true if value else self.false
 
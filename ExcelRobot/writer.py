@@ -1,26 +1,128 @@
+import csv
+import functools
+import io
 import logging
+import os
 
-import openpyxl
+from ExcelRobot.books import OpenpyxlBook, OverlayBook, SheetOverlay
+from ExcelRobot.cache import WORKBOOK_CACHE
+from ExcelRobot.metrics import METRICS, count, timed, timed_call
 from ExcelRobot.reader import ExcelReader
+from ExcelRobot.reference import parse_cell
 from ExcelRobot.utils import (BoolFormat, DataType, DateFormat, NumberFormat,
-                              copy_file, del_file, excel_name2coord,
-                              get_file_path, is_file, random_temp_file)
+                              del_file, get_file_path, is_file, replace_file,
+                              temp_file_beside)
 from six import PY2
-from xlutils.copy import copy
-from xlwt import Workbook, easyxf
 
 LOGGER = logging.getLogger(__name__)
 
+# Rows kept in memory by xlwt before they are serialized
+XLS_FLUSH_ROWS = 1000
+
+
+def xls_style(data_format):
+    from xlwt import easyxf
+    return easyxf('', num_format_str=data_format)
+
+
+class StyleRegistry(object):
+    """
+    Registry of cell styles keyed by number format, so each style is built once per workbook and then reused.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._styles = {}
+        self.hits = 0
+
+    def get(self, data_format):
+        style = self._styles.get(data_format)
+        if style is None:
+            style = self._styles[data_format] = self._factory(data_format)
+        else:
+            self.hits += 1
+        return style
+
+    def stats(self):
+        return {'hits': self.hits, 'styles': len(self._styles)}
+
+
+class ValueConverter(object):
+    """
+    Converts values to write to the raw value and the Excel number format, with the configured formats.
+    """
+
+    def __init__(self, date_format=DateFormat(), number_format=NumberFormat(), bool_format=BoolFormat()):
+        self.date_format = date_format
+        self.number_format = number_format
+        self.bool_format = bool_format
+
+    def convert(self, dtype, value):
+        """
+        Returns the raw value and the Excel number format to write the given value.
+        """
+        if DataType.is_bool(dtype, value):
+            return self.bool_format.parse(value), None
+        if DataType.is_date(dtype, value):
+            return self.date_format.parse(dtype, value), self.date_format.get_excel_format(dtype, value)
+        if DataType.is_number(dtype, value):
+            return self.number_format.parse(dtype, value), self.number_format.get_excel_format(dtype)
+        return str(value), None
+
+    def column_converter(self, dtype):
+        """
+        Resolves the conversion of the given data type once, for every value of a column.
+        """
+        if dtype is None:
+            return functools.partial(self.convert, None)
+        if DataType.is_bool(dtype):
+            return lambda value: (self.bool_format.parse(value), None)
+        if DataType.is_date(dtype):
+            return lambda value: (self.date_format.parse(dtype, value), self.date_format.get_excel_format(dtype, value))
+        if DataType.is_number(dtype):
+            nformat = self.number_format.get_excel_format(dtype)
+            return lambda value: (self.number_format.parse(dtype, value), nformat)
+        return lambda value: (str(value), None)
+
+    def column_converters(self, data_types, width):
+        """
+        Returns the converter of each column. `data_types` is one data type for every column, a list or a comma
+        separated string of data type per column.
+        """
+        if isinstance(data_types, str):
+            data_types = data_types.split(',')
+        data_types = [dtype.strip() if dtype else None for dtype in (data_types or [None])]
+        if len(data_types) == 1:
+            data_types = data_types * width
+        data_types = data_types[:width] + [None] * (width - len(data_types))
+        return [self.column_converter(DataType.parse_type(dtype)) for dtype in data_types]
+
 
 class XlsWriter:
     def __init__(self, workbook=None):
-        self.wwb = copy(workbook) if workbook else Workbook(encoding='utf8')
+        from xlwt import Workbook
+        if workbook:
+            from xlutils.copy import copy
+            self.wwb = timed_call('copy', copy, workbook)
+        else:
+            self.wwb = Workbook(encoding='utf8')
+        self.styles = StyleRegistry(xls_style)
+        # xlwt cannot be read back, written cells are kept to be read on top of the parsed workbook
+        self.sheet_names = workbook.sheet_names() if workbook else []
+        self.overlays = {}
         # Init sheet with new file
         if not workbook:
             self.create_sheet('Sheet')
 
     def create_sheet(self, sheet_name):
         self.wwb.add_sheet(sheet_name)
+        self.sheet_names.append(sheet_name)
+
+    def get_overlay(self, sheet_name):
+        overlay = self.overlays.get(sheet_name)
+        if overlay is None:
+            overlay = self.overlays[sheet_name] = SheetOverlay()
+        return overlay
 
     def write_to_cell(self, sheet_name, column, row, value, data_format=None):
         LOGGER.info('XLS Writer...')
@@ -30,7 +132,21 @@ class XlsWriter:
         LOGGER.debug('row %s', row)
         LOGGER.debug('Type value %s', type(value))
         LOGGER.debug('Data format %s', str(data_format))
-        sheet.write(int(row), int(column), label=value, style=easyxf('', num_format_str=data_format))
+        sheet.write(int(row), int(column), label=value, style=self.styles.get(data_format))
+        self.get_overlay(sheet_name).write(int(row), int(column), value, self.wwb.dates_1904)
+
+    def write_rows(self, sheet_name, column, row, rows):
+        sheet = self.wwb.get_sheet(sheet_name)
+        overlay = self.get_overlay(sheet_name)
+        for row_index, cells in enumerate(rows, row):
+            for col_index, cell in enumerate(cells, column):
+                if cell is not None:
+                    sheet.write(row_index, col_index, label=cell[0], style=self.styles.get(cell[1]))
+                    overlay.write(row_index, col_index, cell[0], self.wwb.dates_1904)
+
+    def next_row(self, sheet_name):
+        sheet = self.wwb.get_sheet(sheet_name)
+        return sheet.last_used_row + 1 if sheet.get_rows() else 0
 
     def save(self, new_path):
         self.wwb.save(new_path)
@@ -39,7 +155,9 @@ class XlsWriter:
 class XlsxWriter:
     def __init__(self, file_path, is_new=False):
         LOGGER.debug('Opening writeable file at %s', file_path)
-        self.wwb = openpyxl.Workbook() if is_new else openpyxl.load_workbook(file_path, data_only=True)
+        import openpyxl
+        self.wwb = openpyxl.Workbook() if is_new else timed_call('parse', openpyxl.load_workbook, file_path,
+                                                                 data_only=True)
 
     def create_sheet(self, sheet_name):
         self.wwb.create_sheet(title=sheet_name)
@@ -56,10 +174,106 @@ class XlsxWriter:
         if data_format:
             cell.number_format = data_format
 
+    def write_rows(self, sheet_name, column, row, rows):
+        sheet = self.wwb[sheet_name]
+        for row_index, cells in enumerate(rows, row + 1):
+            for col_index, cell in enumerate(cells, column + 1):
+                if cell is not None:
+                    xcell = sheet.cell(row=row_index, column=col_index, value=cell[0])
+                    if cell[1]:
+                        xcell.number_format = cell[1]
+
+    def next_row(self, sheet_name):
+        sheet = self.wwb[sheet_name]
+        if sheet.max_row == 1 and all(value is None for value in next(sheet.iter_rows(max_row=1, values_only=True))):
+            return 0
+        return sheet.max_row
+
     def save(self, new_path):
         self.wwb.save(new_path)
 
 
+def _convert_rows(rows, converter, data_types, header):
+    converters = []
+    for row_index, values in enumerate(rows):
+        if header and row_index == 0:
+            yield [(value, None) if value != '' else None for value in values]
+            continue
+        if len(values) > len(converters):
+            converters = converter.column_converters(data_types, len(values))
+        yield [converters[idx](value) if value != '' else None for idx, value in enumerate(values)]
+
+
+def _write_xlsx_rows(file_path, sheet_name, rows):
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    row_count = 0
+    for cells in rows:
+        values = []
+        for cell in cells:
+            if cell is not None and cell[1]:
+                value = WriteOnlyCell(sheet, value=cell[0])
+                value.number_format = cell[1]
+                values.append(value)
+            else:
+                values.append(None if cell is None else cell[0])
+        sheet.append(values)
+        count('cells_written', len(cells) - cells.count(None))
+        row_count += 1
+    workbook.save(file_path)
+    return row_count
+
+
+def _write_xls_rows(file_path, sheet_name, rows):
+    from xlwt import Workbook
+    workbook = Workbook(encoding='utf8')
+    sheet = workbook.add_sheet(sheet_name)
+    styles = StyleRegistry(xls_style)
+    row_count = 0
+    for row_index, cells in enumerate(rows):
+        for col_index, cell in enumerate(cells):
+            if cell is not None:
+                sheet.write(row_index, col_index, label=cell[0], style=styles.get(cell[1]))
+        count('cells_written', len(cells) - cells.count(None))
+        row_count += 1
+        if row_count % XLS_FLUSH_ROWS == 0:
+            sheet.flush_row_data()
+    workbook.save(file_path)
+    return row_count
+
+
+def import_csv(csv_path, file_path, sheet_name='Sheet1', data_types=None, delimiter=',', header=False,
+               encoding='utf-8', override=False, converter=ValueConverter()):
+    """
+    Creates an Excel file with one sheet from a CSV file and returns the number of imported rows.
+
+    Rows are converted and written one by one: `xlsx` file is written by openpyxl `write_only` workbook and `xls` file
+    flushes rows regularly, so memory does not grow with the CSV file. Empty values are left as empty cells.
+    """
+    file_path = get_file_path(file_path)
+    if is_file(file_path) and not override:
+        message = 'File ' + file_path + ' already existed. Use `override=True` to force override file'
+        raise IOError(message) if PY2 else FileExistsError(message)
+    extension = 'xlsx' if file_path.endswith('.xlsx') else 'xls'
+    temp_path = temp_file_beside(file_path, ext=extension)
+    LOGGER.debug('Import CSV file %s to %s via %s', csv_path, file_path, temp_path)
+    try:
+        with io.open(csv_path, encoding=encoding, newline='') as handle:
+            rows = _convert_rows(csv.reader(handle, delimiter=delimiter), converter, data_types, header)
+            write_rows = _write_xlsx_rows if extension == 'xlsx' else _write_xls_rows
+            row_count = write_rows(temp_path, sheet_name, rows)
+        WORKBOOK_CACHE.invalidate(file_path)
+        replace_file(temp_path, file_path)
+        if METRICS.enabled:
+            METRICS.count('bytes_saved', os.path.getsize(file_path))
+    finally:
+        if is_file(temp_path):
+            del_file(temp_path)
+    return row_count
+
+
 class ExcelWriter(ExcelReader):
 
     def __init__(self, file_path, new_path=None, override=False,
@@ -67,31 +281,69 @@ class ExcelWriter(ExcelReader):
         self.is_update = new_path is None or new_path == file_path
         self.new_path = None if self.is_update else get_file_path(new_path)
         self.override = override
+        self.writer = None
+        self.converter = ValueConverter(date_format, number_format, bool_format)
         if self.new_path and is_file(self.new_path):
             if self.override:
                 del_file(self.new_path)
+                WORKBOOK_CACHE.invalidate(self.new_path)
             else:
                 message = 'File ' + self.new_path + ' already existed. Use `override=True` to force override file'
                 raise IOError(message) if PY2 else FileExistsError(message)
         try:
             super(ExcelWriter, self).__init__(file_path, date_format, number_format, bool_format)
-            self.writer = XlsWriter(self.workbook) if self.is_xls else XlsxWriter(self.file_path)
+            self.writer = XlsWriter(self._workbook) if self.is_xls else XlsxWriter(self.file_path)
+            self._workbook = OverlayBook(self._workbook, self.writer) if self.is_xls else None
             self.is_new = False
         except (IOError if PY2 else FileNotFoundError) as _:
             LOGGER.debug('Create new Excel file in %s', self.file_path)
             self.writer = XlsWriter() if self.is_xls else XlsxWriter(self.file_path, is_new=True)
             self.is_new = True
 
-    def save_excel(self):
+    def _load_workbook(self):
+        """
+        Returns the read side of the writer, which sees the written cells before the file is saved.
+        """
+        self._indexes = {}
+        # xls is parsed outside of the workbook cache: the book is released on save, which must not affect the
+        # readers sharing the cached book of the same file
+        if not self.writer:
+            # xlsx is parsed once by openpyxl, the read side is served from the same in-memory model
+            return self._open_workbook(self.file_path) if self.is_xls else None
+        if self.is_xls:
+            return OverlayBook(self._open_workbook(self.file_path) if is_file(self.file_path) else None, self.writer)
+        return OpenpyxlBook(self.writer.wwb)
+
+    def close(self):
+        """
+        Discards the written workbook, changes that are not saved are lost.
         """
-        Saves the Excel file
+        super(ExcelWriter, self).close()
+        self.writer = None
+
+    @timed('save')
+    def save_excel(self, fsync=False, backup=False):
         """
-        save_path = self.file_path if self.is_new else random_temp_file(ext=self.extension) if self.is_update else self.new_path
-        LOGGER.debug('Save Excel file to %s', save_path)
-        self.writer.save(save_path)
-        if not self.is_new and self.is_update:
-            self.workbook.release_resources()
-            copy_file(save_path, self.file_path, True)
+        Saves the Excel file.
+
+        The workbook is written to a temporary file in the destination directory, then replaces the destination
+        atomically, so a failure never leaves a partial or missing file.
+        """
+        save_path = self.file_path if self.is_new or self.is_update else self.new_path
+        temp_path = temp_file_beside(save_path, ext=self.extension)
+        LOGGER.debug('Save Excel file to %s via %s', save_path, temp_path)
+        try:
+            self.writer.save(temp_path)
+            WORKBOOK_CACHE.invalidate(save_path)
+            if self.is_xls and not self.is_new and self.is_update:
+                self.workbook.release_resources()
+                self._workbook = None
+            replace_file(temp_path, save_path, fsync, backup)
+            if METRICS.enabled:
+                METRICS.count('bytes_saved', os.path.getsize(save_path))
+        finally:
+            if is_file(temp_path):
+                del_file(temp_path)
 
     def create_sheet(self, sheet_name):
         """
@@ -100,7 +352,7 @@ class ExcelWriter(ExcelReader):
         self.writer.create_sheet(sheet_name)
 
     def write_to_cell_by_name(self, sheet_name, cell_name, value, data_type=None):
-        col, row = excel_name2coord(cell_name)
+        col, row = parse_cell(cell_name)
         self.write_to_cell(sheet_name, col, row, value, data_type)
 
     def write_to_cell(self, sheet_name, column, row, value, data_type=None):
@@ -111,27 +363,58 @@ class ExcelWriter(ExcelReader):
         LOGGER.debug('Write To Sheet: %s - Col: %s - Row: %s', sheet_name, column, row)
         LOGGER.debug('Data Type: %s', dtype)
         LOGGER.debug('Value Type: %s', type(value))
-        if DataType.is_bool(dtype, value):
-            self.writer.write_to_cell(sheet_name, column, row, self.bool_format.parse(value))
-        elif DataType.is_date(dtype, value):
-            raw_value = self.date_format.parse(dtype, value)
-            dformat = self.date_format.get_excel_format(dtype, value)
-            LOGGER.debug('Write Date Value:')
-            LOGGER.debug('Raw Type: %s', type(raw_value))
-            LOGGER.debug(raw_value)
-            LOGGER.debug('Excel Format: %s', dformat)
-            LOGGER.debug('-' * 10)
-            self.writer.write_to_cell(sheet_name, column, row, raw_value, dformat)
-        elif DataType.is_number(dtype, value):
-            raw_value = self.number_format.parse(dtype, value)
-            nformat = self.number_format.get_excel_format(dtype)
-            LOGGER.debug('Raw Type: %s', type(raw_value))
-            LOGGER.debug(raw_value)
-            LOGGER.debug('Excel Format: %s', nformat)
-            LOGGER.debug('-' * 10)
-            self.writer.write_to_cell(sheet_name, column, row, raw_value, nformat)
-        else:
-            self.writer.write_to_cell(sheet_name, column, row, str(value))
+        raw_value, data_format = timed_call('convert', self.converter.convert, dtype, value)
+        LOGGER.debug('Raw Type: %s - Excel Format: %s', type(raw_value), data_format)
+        self.writer.write_to_cell(sheet_name, column, row, raw_value, data_format)
+        count('cells_written')
+        self._indexes = {}
+
+    def write_range(self, sheet_name, cell_name, rows, data_types=None):
+        """
+        Writes the 2-D list `rows` to the sheet, starting at the cell defined by name.
+        """
+        col, row = parse_cell(cell_name)
+        self.write_rows(sheet_name, col, row, rows, data_types)
+
+    def write_rows(self, sheet_name, column, row, rows, data_types=None):
+        """
+        Writes the 2-D list `rows` to the sheet, starting at the given column and row.
+
+        `data_types` is one data type for every cell or a list of data type per column.
+        `None` values are skipped and keep the current cell content.
+        """
+        converted = timed_call('convert', self._convert_write_rows, rows, data_types)
+        LOGGER.debug('Write %d rows to Sheet: %s - Col: %s - Row: %s', len(converted), sheet_name, column, row)
+        self.writer.write_rows(sheet_name, int(column), int(row), converted)
+        if METRICS.enabled:
+            METRICS.count('cells_written', sum(len(cells) - cells.count(None) for cells in converted))
+        self._indexes = {}
+
+    def _convert_write_rows(self, rows, data_types):
+        converters = self.converter.column_converters(data_types, max([len(values) for values in rows] or [0]))
+        return [[None if value is None else converters[idx](value) for idx, value in enumerate(values)]
+                for values in rows]
+
+    def append_rows(self, sheet_name, rows, column=0, data_types=None):
+        """
+        Writes the 2-D list `rows` to the sheet, below the last used row.
+        """
+        self.write_rows(sheet_name, column, self.writer.next_row(sheet_name), rows, data_types)
+
+    def get_workbook_values(self, include_empty_cells=True, workers=1):
+        """
+        Returns the values from each sheet of the written workbook. Sheets are always read in the current process,
+        since values that are not saved yet are not in the file.
+        """
+        return super(ExcelWriter, self).get_workbook_values(include_empty_cells)
+
+    def get_style_stats(self):
+        """
+        Returns the counters of the style registry of xls file: `hits` and number of unique `styles`.
+        """
+        if not self.is_xls:
+            raise ValueError('Style registry is only used by xls file, openpyxl shares number formats itself')
+        return self.writer.styles.stats()
 
     def modify_cell_with(self, sheet_name, column, row, op, val):
         """
@@ -0,0 +1,52 @@
+#!/usr/bin/python
+"""
+Runs the benchmarks of the keyword paths on generated workbooks.
+
+    python -m tests.benchmark --rows 10000 --columns 10 --output baseline.json
+    python -m tests.benchmark --rows 10000 --columns 10 --compare baseline.json
+"""
+import argparse
+import sys
+
+from tests.benchmark.generator import TYPES, Shape
+from tests.benchmark.runner import (CASES, DEFAULT_THRESHOLD, compare,
+                                    load_baseline, run_benchmarks,
+                                    save_baseline)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmark', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--sheets', type=int, default=1)
+    parser.add_argument('--types', default=','.join(TYPES), help='Column types in turn, among ' + ','.join(TYPES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--extensions', default='xls,xlsx')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', help='Comma separated cases, among import,' + ','.join(case[0] for case in CASES))
+    parser.add_argument('--output', help='Save the results to this JSON file')
+    parser.add_argument('--compare', help='Compare the results with this JSON baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Slowdown ratio reported as regression (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    shape = Shape(args.rows, args.columns, args.sheets, args.types, args.seed)
+    report = run_benchmarks(shape, args.extensions.split(','), args.repeat,
+                            args.cases.split(',') if args.cases else None)
+    for name, result in report['results'].items():
+        memory = result['peak_memory'] / 1024.0 / 1024.0 if result['peak_memory'] is not None else float('nan')
+        print('%-36s %10.4fs %12s cells/s %10.1f MB' % (name, result['seconds'], result['cells_per_second'], memory))
+    if args.output:
+        save_baseline(report, args.output)
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        rows, regressions = compare(report, baseline, args.threshold)
+        print('\nCompared with %s (revision %s)' % (args.compare, baseline.get('revision')))
+        for name, before, after, ratio in rows:
+            print('%-36s %10.4fs %10.4fs %7.2fx%s' % (name, before, after, ratio, ' !' if name in regressions else ''))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import random
+from datetime import datetime, timedelta
+
+import openpyxl
+from xlwt import Workbook, easyxf
+
+TYPES = ('text', 'number', 'date', 'bool')
+DATE_FORMAT = 'yyyy-mm-dd'
+
+
+class Shape(object):
+    """
+    Shape of a generated workbook. `types` is the type of each column in turn, among `TYPES`.
+    """
+
+    def __init__(self, rows=1000, columns=10, sheets=1, types=TYPES, seed=0):
+        self.rows = int(rows)
+        self.columns = int(columns)
+        self.sheets = int(sheets)
+        self.types = tuple(types.split(',') if isinstance(types, str) else types)
+        unknown = [ctype for ctype in self.types if ctype not in TYPES]
+        if unknown:
+            raise ValueError('Invalid types: ' + ','.join(unknown) + '. Only support: ' + ','.join(TYPES))
+        self.seed = int(seed)
+
+    @property
+    def cells(self):
+        return self.rows * self.columns * self.sheets
+
+    def column_type(self, column):
+        return self.types[column % len(self.types)]
+
+    def sheet_name(self, index):
+        return 'Sheet' + str(index + 1)
+
+    def to_dict(self):
+        return {'rows': self.rows, 'columns': self.columns, 'sheets': self.sheets, 'types': ','.join(self.types),
+                'seed': self.seed}
+
+
+def generate_rows(shape, sheet_index):
+    """
+    Yields the values of each row of a sheet: a header row, then `shape.rows - 1` rows of random values that only
+    depend on the seed.
+    """
+    rand = random.Random('%d-%d' % (shape.seed, sheet_index))
+    yield ['Column' + str(column + 1) for column in range(shape.columns)]
+    epoch = datetime(2000, 1, 1)
+    for row in range(1, shape.rows):
+        values = []
+        for column in range(shape.columns):
+            ctype = shape.column_type(column)
+            if ctype == 'text':
+                values.append('Value%d' % rand.randint(0, shape.rows))
+            elif ctype == 'number':
+                values.append(round(rand.uniform(-1E6, 1E6), 2))
+            elif ctype == 'date':
+                values.append(epoch + timedelta(days=rand.randint(0, 10000)))
+            else:
+                values.append(rand.random() < 0.5)
+        yield values
+
+
+def generate_workbook(file_path, shape):
+    """
+    Writes a workbook of the given shape to `file_path`, `xls` or `xlsx` by extension, with the same values for the
+    same shape.
+    """
+    if file_path.endswith('.xlsx'):
+        workbook = openpyxl.Workbook(write_only=True)
+        for sheet_index in range(shape.sheets):
+            sheet = workbook.create_sheet(shape.sheet_name(sheet_index))
+            for values in generate_rows(shape, sheet_index):
+                sheet.append(values)
+        workbook.save(file_path)
+        return file_path
+    workbook = Workbook(encoding='utf8')
+    date_style = easyxf('', num_format_str=DATE_FORMAT)
+    for sheet_index in range(shape.sheets):
+        sheet = workbook.add_sheet(shape.sheet_name(sheet_index))
+        for row, values in enumerate(generate_rows(shape, sheet_index)):
+            for column, value in enumerate(values):
+                if isinstance(value, datetime):
+                    sheet.write(row, column, value, date_style)
+                else:
+                    sheet.write(row, column, value)
+    workbook.save(file_path)
+    return file_path
@@ -0,0 +1,211 @@
+import gc
+import json
+import os.path as path
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from ExcelRobot.base import ExcelLibrary
+from ExcelRobot.cache import SHEET_RESIDENCY, WORKBOOK_CACHE
+from tests.benchmark.generator import generate_workbook
+from xlrd import colname
+
+ROOT_DIR = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+SHEET = 'Sheet1'
+DEFAULT_THRESHOLD = 0.2
+# Slowdowns shorter than this are timer noise rather than regressions
+MIN_SLOWDOWN = 0.005
+
+
+class Context(object):
+    """
+    State of a benchmark case: the generated workbook, its shape and a temporary directory for written files.
+    """
+
+    def __init__(self, source, shape, temp_dir):
+        self.source = source
+        self.shape = shape
+        self.temp_dir = temp_dir
+        self.extension = 'xlsx' if source.endswith('.xlsx') else 'xls'
+        self.library = ExcelLibrary()
+        self.rows = []
+
+    def output(self, name):
+        return path.join(self.temp_dir, name + '.' + self.extension)
+
+    def typed(self, column):
+        return {'text': 'TEXT', 'number': 'NUMBER', 'date': 'DATE', 'bool': 'BOOL'}[self.shape.column_type(column)]
+
+
+def _cold_open(ctx):
+    WORKBOOK_CACHE.clear()
+    SHEET_RESIDENCY.clear()
+
+
+def _open(ctx):
+    ctx.library.open_excel(ctx.source)
+
+
+def _open_to_write(ctx):
+    WORKBOOK_CACHE.clear()
+    ctx.library.open_excel_to_write(ctx.source, ctx.output('written'), override=True)
+
+
+def _read_cells(ctx):
+    for row in range(1, ctx.shape.rows):
+        for column in range(ctx.shape.columns):
+            ctx.library.read_cell_data(SHEET, column, row)
+
+
+def _read_typed_cells(ctx):
+    types = [ctx.typed(column) for column in range(ctx.shape.columns)]
+    for row in range(1, ctx.shape.rows):
+        for column in range(ctx.shape.columns):
+            ctx.library.read_cell_data(SHEET, column, row, types[column], False)
+
+
+def _write_cells(ctx):
+    for row, values in enumerate(ctx.rows):
+        for column, value in enumerate(values):
+            ctx.library.write_to_cell(SHEET, column, row, value)
+
+
+def _prepare_write(ctx):
+    if not ctx.rows:
+        ctx.library.open_excel(ctx.source)
+        ctx.rows = ctx.library.get_sheet_values_as_table(SHEET)
+    _open_to_write(ctx)
+
+
+WORKBOOK = 'workbook'
+SHEET_ONLY = 'sheet'
+
+# (name, cells processed by a run: whole workbook or one sheet, untimed setup, timed run)
+CASES = [
+    ('open_excel', WORKBOOK, _cold_open, _open),
+    ('open_excel_cached', WORKBOOK, _open, _open),
+    ('open_excel_to_write', WORKBOOK, None, _open_to_write),
+    ('get_sheet_values', SHEET_ONLY, _open, lambda ctx: ctx.library.get_sheet_values(SHEET)),
+    ('get_sheet_values_as_table', SHEET_ONLY, _open, lambda ctx: ctx.library.get_sheet_values_as_table(SHEET)),
+    ('get_workbook_values', WORKBOOK, _open, lambda ctx: ctx.library.get_workbook_values()),
+    ('read_range', SHEET_ONLY, _open, lambda ctx: ctx.library.read_range(SHEET, 'A:' + _last_column(ctx))),
+    ('read_cell_data', SHEET_ONLY, _open, _read_cells),
+    ('read_typed_cell_data', SHEET_ONLY, _open, _read_typed_cells),
+    ('find_rows_by_values', SHEET_ONLY, _open, lambda ctx: ctx.library.find_rows_by_values(SHEET, '0', 'Value0')),
+    ('write_to_cell', SHEET_ONLY, _prepare_write, _write_cells),
+    ('write_rows', SHEET_ONLY, _prepare_write, lambda ctx: ctx.library.write_rows(SHEET, 0, 0, ctx.rows)),
+    ('save_excel', WORKBOOK, _open_to_write, lambda ctx: ctx.library.save_excel()),
+    ('export_sheet_to_csv', SHEET_ONLY, _open,
+     lambda ctx: ctx.library.export_sheet_to_csv(SHEET, path.join(ctx.temp_dir, 'export.csv'))),
+]
+
+
+def _last_column(ctx):
+    return colname(ctx.shape.columns - 1)
+
+
+def measure(ctx, scope, setup, run, repeat):
+    """
+    Returns the best time of `repeat` runs and the peak memory allocated by one more run, traced separately so
+    tracing does not slow down the timed runs.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup(ctx)
+        gc.collect()
+        start = time.perf_counter()
+        run(ctx)
+        timings.append(time.perf_counter() - start)
+    if setup:
+        setup(ctx)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(ctx)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    seconds = min(timings)
+    cells = ctx.shape.rows * ctx.shape.columns if scope == SHEET_ONLY else ctx.shape.cells
+    return OrderedDict([('seconds', round(seconds, 6)), ('cells', cells),
+                        ('cells_per_second', round(cells / seconds) if seconds else None), ('peak_memory', peak)])
+
+
+def measure_import(module='ExcelRobot', repeat=3):
+    """
+    Returns the best cumulative import time of the module in a fresh interpreter, as reported by `-X importtime`.
+    """
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                                         stderr=subprocess.STDOUT, cwd=ROOT_DIR).decode()
+        match = re.search(r'\|\s*(\d+) \| ' + re.escape(module) + r'$', output, re.MULTILINE)
+        timings.append(int(match.group(1)) / 1E6)
+    return OrderedDict([('seconds', min(timings)), ('cells', 0), ('cells_per_second', None), ('peak_memory', None)])
+
+
+def git_revision(cwd):
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=cwd,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(shape, extensions=('xls', 'xlsx'), repeat=3, cases=None):
+    """
+    Generates a workbook of the given shape per extension and runs the benchmark cases on it.
+    Returns the results as a dictionary that can be saved as a JSON baseline.
+    """
+    temp_dir = tempfile.mkdtemp(prefix='excelrobot-benchmark-')
+    results = OrderedDict()
+    if not cases or 'import' in cases:
+        results['import'] = measure_import(repeat=int(repeat))
+    try:
+        for extension in extensions:
+            source = generate_workbook(path.join(temp_dir, 'source.' + extension), shape)
+            ctx = Context(source, shape, temp_dir)
+            for name, scope, setup, run in CASES:
+                if cases and name not in cases:
+                    continue
+                results[extension + '.' + name] = measure(ctx, scope, setup, run, int(repeat))
+            ctx.library.close_all_excel()
+    finally:
+        WORKBOOK_CACHE.clear()
+        shutil.rmtree(temp_dir)
+    return OrderedDict([('revision', git_revision(ROOT_DIR)),
+                        ('python', platform.python_version()), ('shape', shape.to_dict()), ('results', results)])
+
+
+def save_baseline(report, file_path):
+    with open(file_path, 'w') as handle:
+        json.dump(report, handle, indent=2)
+
+
+def load_baseline(file_path):
+    with open(file_path) as handle:
+        return json.load(handle)
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Returns `(name, baseline seconds, seconds, ratio)` of each case of both reports, and the names of the cases that
+    are slower than the baseline by more than `threshold` and `MIN_SLOWDOWN` seconds.
+    """
+    rows, regressions = [], []
+    for name, result in report['results'].items():
+        base = baseline['results'].get(name)
+        if not base or not base['seconds']:
+            continue
+        ratio = result['seconds'] / base['seconds']
+        rows.append((name, base['seconds'], result['seconds'], ratio))
+        if ratio > 1 + threshold and result['seconds'] - base['seconds'] > MIN_SLOWDOWN:
+            regressions.append(name)
+    return rows, regressions
@@ -0,0 +1,41 @@
+#!/usr/bin/python
+import filecmp
+import os.path as path
+
+import pytest
+
+from ExcelRobot.reader import ExcelReader
+from tests.benchmark.generator import Shape, generate_workbook
+from tests.benchmark.runner import compare, run_benchmarks
+
+
+@pytest.mark.parametrize('ext', ['xls', 'xlsx'])
+def test_generate_workbook(tmp_path, ext):
+    shape = Shape(rows=20, columns=5, sheets=2)
+    first = generate_workbook(path.join(tmp_path, 'first.' + ext), shape)
+    second = generate_workbook(path.join(tmp_path, 'second.' + ext), shape)
+    reader = ExcelReader(first)
+    assert reader.get_sheet_names() == ['Sheet1', 'Sheet2']
+    assert reader.get_row_count('Sheet1') == 20
+    assert reader.get_column_count('Sheet1') == 5
+    assert reader.check_cell_type('Sheet1', 2, 1, 'DATE')
+    assert reader.compare_workbook(ExcelReader(second))['equal']
+    if ext == 'xls':
+        assert filecmp.cmp(first, second, shallow=False)
+
+
+def test_invalid_type():
+    with pytest.raises(ValueError):
+        Shape(types='text,blob')
+
+
+def test_run_and_compare():
+    report = run_benchmarks(Shape(rows=10, columns=4), ['xlsx'], repeat=1, cases=['open_excel', 'read_range'])
+    assert list(report['results']) == ['xlsx.open_excel', 'xlsx.read_range']
+    assert report['results']['xlsx.read_range']['cells'] == 40
+    slower = {'results': dict((name, dict(result, seconds=result['seconds'] + 1))
+                              for name, result in report['results'].items())}
+    rows, regressions = compare(slower, report)
+    assert len(rows) == 2
+    assert regressions == ['xlsx.open_excel', 'xlsx.read_range']
+    assert compare(report, slower)[1] == []
@@ -0,0 +1,139 @@
+#!/usr/bin/python
+import os
+import os.path as path
+import shutil
+
+import pytest
+
+from ExcelRobot.cache import WORKBOOK_CACHE, SheetResidency, WorkbookCache
+from ExcelRobot.reader import ExcelReader
+from ExcelRobot.utils import random_name
+from ExcelRobot.writer import ExcelWriter
+from xlrd import open_workbook
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+
+
+@pytest.fixture
+def tmp_copy(tmp_path):
+    def _copy(input_file):
+        dest = path.join(tmp_path, random_name() + '_' + input_file)
+        shutil.copy(path.join(DATA_DIR, input_file), dest)
+        return dest
+
+    return _copy
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_reopen_hits_cache(input_file):
+    file_path = path.join(DATA_DIR, input_file)
+    first = ExcelReader(file_path)
+    second = ExcelReader(file_path)
+    assert first.workbook is second.workbook
+
+
+def test_changed_file_is_parsed_again(tmp_copy):
+    file_path = tmp_copy('ExcelRobotTest.xls')
+    first = ExcelReader(file_path)
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert ExcelReader(file_path).workbook is not first.workbook
+
+
+def test_lru_eviction():
+    cache = WorkbookCache(max_bytes=2 * path.getsize(path.join(DATA_DIR, 'ExcelRobotTest.xls')))
+    loads = []
+
+    def loader(file_path):
+        loads.append(file_path)
+        return object()
+
+    xls = path.join(DATA_DIR, 'ExcelRobotTest.xls')
+    xlsx = path.join(DATA_DIR, 'ExcelRobotTest.xlsx')
+    cache.get(xls, loader)
+    cache.get(xlsx, loader)
+    cache.get(xls, loader)
+    assert loads == [xls, xlsx]
+    assert cache.stats()['hits'] == 1
+    cache.resize(path.getsize(xls))
+    assert cache.stats()['entries'] == 1
+    cache.get(xls, loader)
+    assert loads == [xls, xlsx]
+
+
+def test_disabled_cache():
+    cache = WorkbookCache(max_bytes=0)
+    file_path = path.join(DATA_DIR, 'ExcelRobotTest.xls')
+    assert cache.get(file_path, lambda _: object()) is not cache.get(file_path, lambda _: object())
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_save_invalidates_cache(tmp_copy, input_file):
+    file_path = tmp_copy(input_file)
+    before = ExcelReader(file_path).workbook
+    writer = ExcelWriter(file_path)
+    writer.create_sheet('Cached')
+    writer.save_excel()
+    after = ExcelReader(file_path)
+    assert after.workbook is not before
+    assert 'Cached' in after.get_sheet_names()
+    assert path.realpath(file_path) in [key[0] for key in WORKBOOK_CACHE._entries]
+
+
+def test_sheet_residency_unloads_least_recently_used():
+    residency = SheetResidency(max_sheets=2)
+    book = open_workbook(path.join(DATA_DIR, 'ExcelRobotTest.xls'), formatting_info=True, on_demand=True)
+    names = book.sheet_names()
+    first = residency.sheet_by_name(book, names[0])
+    residency.sheet_by_name(book, names[1])
+    residency.sheet_by_name(book, names[0])
+    residency.sheet_by_name(book, names[2])
+    assert [book.sheet_loaded(index) for index in range(3)] == [True, False, True]
+    assert residency.sheet_by_name(book, names[1]).name == names[1]
+    assert not book.sheet_loaded(0)
+    assert residency.sheet_by_name(book, names[0]).row_values(0) == first.row_values(0)
+    assert residency.stats()['hits'] == 1
+    assert residency.stats()['misses'] == 5
+    assert residency.stats()['evictions'] == 3
+
+
+def test_sheet_residency_byte_budget():
+    residency = SheetResidency(max_bytes=1)
+    book = open_workbook(path.join(DATA_DIR, 'ExcelRobotTest.xls'), formatting_info=True, on_demand=True)
+    for name in book.sheet_names():
+        assert residency.sheet_by_name(book, name).name == name
+    assert residency.stats()['sheets'] == 1
+    assert sum(book.sheet_loaded(index) for index in range(book.nsheets)) == 1
+
+
+def test_sheet_residency_without_limit_passes_through():
+    residency = SheetResidency()
+    book = open_workbook(path.join(DATA_DIR, 'ExcelRobotTest.xls'), formatting_info=True, on_demand=True)
+    for name in book.sheet_names():
+        assert residency.sheet_by_name(book, name).name == name
+    assert residency.stats()['sheets'] == 0
+    residency.resize(max_sheets=10)
+    for name in book.sheet_names():
+        residency.sheet_by_name(book, name)
+    assert residency.stats()['sheets'] == book.nsheets
+    assert len(set(entry[0] for entry in residency._entries.values())) == 1
+
+
+def test_sheet_residency_ignores_xlsx():
+    residency = SheetResidency(max_sheets=1)
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xlsx'))
+    for name in reader.get_sheet_names():
+        residency.sheet_by_name(reader.workbook, name)
+    assert residency.stats()['sheets'] == 0
+
+
+def test_save_in_place_keeps_cached_book_of_readers(tmp_copy):
+    file_path = tmp_copy('ExcelRobotTest.xls')
+    reader = ExcelReader(file_path)
+    assert reader.read_cell_data_by_name('TestSheet1', 'A2') == 'User1'
+    writer = ExcelWriter(file_path)
+    writer.write_to_cell_by_name('TestSheet1', 'A2', 'User9')
+    writer.save_excel()
+    assert reader.read_cell_data_by_name('TestSheet2', 'A1') == 'This is a test sheet'
+    assert ExcelReader(file_path).read_cell_data_by_name('TestSheet1', 'A2') == 'User9'
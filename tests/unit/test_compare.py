@@ -0,0 +1,90 @@
+#!/usr/bin/python
+import os.path as path
+from datetime import datetime
+
+import pytest
+
+from ExcelRobot.compare import align_rows
+from ExcelRobot.reader import ExcelReader
+from ExcelRobot.writer import ExcelWriter
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+TEST_ROWS = [['This is a test sheet', 'Points'], ['User1', 57], ['User2', 5178]]
+
+
+def open_pair(tmp_path, input_file, rows):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), path.join(tmp_path, 'compare_' + input_file))
+    writer.create_sheet('Other')
+    writer.write_rows('Other', 0, 0, rows)
+    return reader, writer
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_compare_same_file(input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    diff = reader.compare_workbook(ExcelReader(path.join(DATA_DIR, input_file)))
+    assert diff['equal']
+    assert diff['sheets']['TestSheet1']['equal_rows'] == 3
+
+
+def test_compare_xls_with_xlsx():
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'))
+    assert reader.compare_workbook(ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xlsx')))['equal']
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_compare_inserted_row(tmp_path, input_file):
+    reader, writer = open_pair(tmp_path, input_file, [TEST_ROWS[0], ['User0', 1], TEST_ROWS[1], TEST_ROWS[2]])
+    diff = reader.compare_sheet('TestSheet1', writer, 'Other')
+    assert not diff['equal']
+    assert diff['added_rows'] == [1]
+    assert diff['removed_rows'] == []
+    assert diff['changed_rows'] == 0
+    assert diff['equal_rows'] == 3
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_compare_changed_cells_with_tolerance(tmp_path, input_file):
+    reader, writer = open_pair(tmp_path, input_file, [TEST_ROWS[0], ['User1', 57.5], ['User3', 5178]])
+    diff = reader.compare_sheet('TestSheet1', writer, 'Other')
+    assert diff['changed_rows'] == 2
+    assert diff['cells'] == [('B2', 'B2', 57.0, 57.5), ('A3', 'A3', 'User2', 'User3')]
+    diff = reader.compare_sheet('TestSheet1', writer, 'Other', number_tolerance=0.5, max_differences=0)
+    assert diff['changed_rows'] == 1
+    assert diff['changed_cells'] == 1
+    assert diff['cells'] == []
+
+
+def test_compare_dates_with_tolerance(tmp_path):
+    reader, writer = open_pair(tmp_path, 'ExcelRobotTest.xlsx', [[datetime(2018, 1, 1, 10, 0, 0)]])
+    other = ExcelWriter(path.join(DATA_DIR, 'ExcelRobotTest.xlsx'), path.join(tmp_path, 'other_ExcelRobotTest.xlsx'))
+    other.create_sheet('Other')
+    other.write_rows('Other', 0, 0, [[datetime(2018, 1, 1, 10, 0, 30)]])
+    diff = writer.compare_sheet('Other', other)
+    assert diff['cells'] == [('A1', 'A1', datetime(2018, 1, 1, 10, 0, 0), datetime(2018, 1, 1, 10, 0, 30))]
+    assert writer.compare_sheet('Other', other, date_tolerance=30)['equal']
+
+
+def test_align_repeated_rows():
+    first = [(index % 50,) for index in range(100000)]
+    second = first[:500] + [('inserted',)] + first[500:]
+    del second[20000]
+    assert [opcode for opcode in align_rows(first, second) if opcode[0] != 'equal'] == [
+        ('insert', 500, 500, 500, 501), ('delete', 19999, 20000, 20000, 20000)]
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_compare_duplicate_rows(tmp_path, input_file):
+    rows = [['User' + str(index % 5), index % 5] for index in range(300)]
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), path.join(tmp_path, 'compare_' + input_file))
+    writer.create_sheet('First')
+    writer.create_sheet('Second')
+    writer.write_rows('First', 0, 0, rows)
+    writer.write_rows('Second', 0, 0, rows[:100] + [['User9', 9]] + rows[100:200] + rows[201:])
+    diff = writer.compare_sheet('First', writer, 'Second')
+    assert diff['added_rows'] == [100]
+    assert diff['removed_rows'] == [200]
+    assert diff['changed_rows'] == 0
+    assert diff['equal_rows'] == 299
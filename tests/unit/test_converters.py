@@ -0,0 +1,59 @@
+#!/usr/bin/python
+from datetime import date, datetime, time
+
+import pytest
+
+from ExcelRobot.converters import get_converter
+from ExcelRobot.utils import BoolFormat, DataType, DateFormat, NumberFormat
+
+FORMATS = (DateFormat(), NumberFormat(), BoolFormat())
+
+
+def test_converter_is_cached():
+    converter = get_converter(DataType.NUMBER, None, True, *FORMATS)
+    assert get_converter(DataType.NUMBER, None, True, DateFormat(), NumberFormat(), BoolFormat()) is converter
+    assert get_converter(DataType.NUMBER, None, False, *FORMATS) is not converter
+    assert get_converter(DataType.NUMBER, None, True, DateFormat(), NumberFormat(precision='0'),
+                         BoolFormat()) is not converter
+
+
+@pytest.mark.parametrize('ctype,gtype,use_format,value,expected', [
+    (DataType.NUMBER, None, True, 5178, '5,178.00'),
+    (DataType.NUMBER, DataType.NUMBER, False, 57.0, 57.0),
+    (DataType.BOOL, None, True, 1, 'Yes'),
+    (DataType.BOOL, None, False, 0, 0),
+    (DataType.DATE, None, True, 30085.0, '1982-05-14'),
+    (DataType.DATE, DataType.DATE_TIME, True, 30085.5, '1982-05-14 12:00'),
+    (DataType.DATE, DataType.TIME, True, 0.75, '06:00:00 PM'),
+    (DataType.DATE, DataType.DATE, False, 30085.5, date(1982, 5, 14)),
+    (DataType.DATE, DataType.TIME, False, 0.75, time(18, 0)),
+    (DataType.DATE, None, False, 30085.0, datetime(1982, 5, 14)),
+    (DataType.TEXT, None, True, 'User1', 'User1'),
+])
+def test_convert(ctype, gtype, use_format, value, expected):
+    assert get_converter(ctype, gtype, use_format, *FORMATS)(value) == expected
+
+
+def test_convert_date_in_1904_mode():
+    date_format = DateFormat()
+    converter = get_converter(DataType.DATE, None, True, date_format, *FORMATS[1:])
+    date_format.datemode = 1
+    assert get_converter(DataType.DATE, None, True, date_format, *FORMATS[1:]) is not converter
+    assert get_converter(DataType.DATE, None, True, date_format, *FORMATS[1:])(0) == '1904-01-01'
+
+
+@pytest.mark.parametrize('ctype,use_format,values', [
+    (DataType.DATE, True, [30085.0, 30086.0, 30085.0, 0.5]),
+    (DataType.DATE, False, [30085.0, 30085.0]),
+    (DataType.NUMBER, True, [57, 5178.5, -1]),
+    (DataType.BOOL, True, [1, 0, 1]),
+    (DataType.TEXT, True, ['a', '', 'b']),
+])
+def test_convert_all(ctype, use_format, values):
+    converter = get_converter(ctype, None, use_format, *FORMATS)
+    assert converter.convert_all(values) == [converter.convert(value) for value in values]
+
+
+def test_mismatched_type():
+    with pytest.raises(ValueError):
+        get_converter(DataType.NUMBER, DataType.DATE, True, *FORMATS)
@@ -0,0 +1,66 @@
+#!/usr/bin/python
+import csv
+import io
+import json
+import os
+import os.path as path
+import stat
+
+import pytest
+
+from ExcelRobot.reader import ExcelReader
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+
+
+@pytest.mark.parametrize('input_file,mode', [
+    ('ExcelRobotTest.xls', 'default'), ('ExcelRobotTest.xlsx', 'default'), ('ExcelRobotTest.xlsx', 'streaming')])
+def test_export_sheet_to_csv(tmp_path, input_file, mode):
+    reader = ExcelReader(path.join(DATA_DIR, input_file), mode=mode)
+    file_path = path.join(tmp_path, 'export.csv')
+    assert reader.export_sheet_to_csv('TestSheet1', file_path, delimiter=';') == 3
+    with io.open(file_path, encoding='utf-8', newline='') as handle:
+        assert list(csv.reader(handle, delimiter=';')) == [
+            ['This is a test sheet', 'Points'], ['User1', '57.00'], ['User2', '5,178.00']]
+    assert os.listdir(tmp_path) == ['export.csv']
+
+
+def test_export_sheet_to_csv_with_header(tmp_path):
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'))
+    file_path = path.join(tmp_path, 'export.csv')
+    assert reader.export_sheet_to_csv('DataSheet', file_path, header_row=1, use_format=False) == 2
+    with io.open(file_path, encoding='utf-8', newline='') as handle:
+        assert list(csv.reader(handle)) == [['Team1', '77.0', '72.0', '85.0'], ['Team2', '82.0', '79.0', '92.0'],
+                                            ['Team3', '65.0', '60.0', '79.0']]
+    assert reader.export_sheet_to_csv('DataSheet', file_path, header_row=0) == 3
+    with io.open(file_path, encoding='utf-8', newline='') as handle:
+        assert next(csv.reader(handle)) == ['This is a data sheet', 'Total Score', 'Average Score', 'Max Score']
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_export_sheet_to_jsonl(tmp_path, input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    file_path = path.join(tmp_path, 'export.jsonl')
+    assert reader.export_sheet_to_jsonl('TestSheet3', file_path, header_row=0, use_format=False) == 2
+    with io.open(file_path, encoding='utf-8') as handle:
+        records = [json.loads(line) for line in handle]
+    assert records[0]['Username'] == 'User5'
+    assert records[0]['Id'] == 1
+    assert records[0]['Date of Birth'] == '1982-05-14T00:00:00'
+    assert reader.export_sheet_to_jsonl('TestSheet1', file_path) == 3
+    with io.open(file_path, encoding='utf-8') as handle:
+        assert json.loads(handle.readline()) == ['This is a test sheet', 'Points']
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File mode is not supported on Windows')
+def test_export_keeps_file_mode(tmp_path):
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'))
+    file_path = path.join(tmp_path, 'export.csv')
+    reader.export_sheet_to_csv('TestSheet1', file_path)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o666 & ~umask
+    os.chmod(file_path, 0o640)
+    reader.export_sheet_to_jsonl('TestSheet1', file_path)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
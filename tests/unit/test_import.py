@@ -0,0 +1,37 @@
+#!/usr/bin/python
+import os.path as path
+import subprocess
+import sys
+
+import pytest
+
+from tests.benchmark.runner import measure_import
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+ROOT_DIR = path.dirname(path.dirname(CURRENT_DIR))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+XLS_FILE = path.join(DATA_DIR, 'ExcelRobotTest.xls')
+XLSX_FILE = path.join(DATA_DIR, 'ExcelRobotTest.xlsx')
+LAZY_MODULES = ['openpyxl', 'xlwt', 'xlutils', 'natsort', 'concurrent.futures', 'robot']
+# Generous bound that only catches a backend imported eagerly again, the actual time is tracked by the benchmarks
+IMPORT_TIME_BUDGET = 1.0
+
+
+def test_backends_are_imported_lazily():
+    code = 'import sys, ExcelRobot; print(",".join(m for m in %r if m in sys.modules))' % (LAZY_MODULES,)
+    assert subprocess.check_output([sys.executable, '-c', code], cwd=ROOT_DIR).decode().strip() == ''
+
+
+@pytest.mark.parametrize('code,modules', [
+    ('ExcelRobot.ExcelRobot().open_excel(%r)' % XLS_FILE, []),
+    ('ExcelRobot.ExcelRobot().open_excel(%r, "streaming")' % XLSX_FILE, ['openpyxl']),
+    ('ExcelRobot.ExcelRobot().open_excel_to_write(%r)' % XLS_FILE, ['xlwt', 'xlutils']),
+])
+def test_backends_are_imported_on_use(code, modules):
+    code = 'import sys, ExcelRobot; %s; print(",".join(m for m in %r if m in sys.modules))' % (code, LAZY_MODULES)
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT_DIR)
+    assert output.decode().strip() == ','.join(modules)
+
+
+def test_import_time():
+    assert measure_import()['seconds'] < IMPORT_TIME_BUDGET
@@ -0,0 +1,108 @@
+#!/usr/bin/python
+import json
+import os.path as path
+
+import pytest
+
+from ExcelRobot.base import ExcelLibrary
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+
+
+def test_switch_between_aliases():
+    library = ExcelLibrary()
+    assert library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.xls'), alias='input') == 'input'
+    library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.xlsx'), alias='output')
+    output = library.reader
+    library.switch_excel('input')
+    assert library.reader.is_xls
+    library.switch_excel('output')
+    assert library.reader is output
+    library.close_excel('input')
+    with pytest.raises(ValueError):
+        library.switch_excel('input')
+    library.close_excel()
+    assert library.reader is None
+
+
+def test_open_without_alias_replaces_default():
+    library = ExcelLibrary()
+    assert library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.xls')) == 'read'
+    library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.xlsx'))
+    assert not library.reader.is_xls
+    assert library._excels.aliases() == ['read']
+    library.close_all_excel()
+    assert library._excels.aliases() == []
+    assert library.reader is None
+
+
+def test_open_with_same_alias_closes_replaced():
+    library = ExcelLibrary()
+    library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.xlsx'), mode='streaming')
+    replaced = library.reader
+    cursor = library.reader.open_row_cursor('TestSheet1')
+    library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.xlsx'), mode='streaming')
+    assert replaced._workbook is None
+    with pytest.raises(ValueError):
+        replaced.fetch_rows(cursor)
+    library.open_excel_to_write(path.join(DATA_DIR, 'ExcelRobotTest.xls'), use_for_reading=True)
+    library.open_excel_to_write(path.join(DATA_DIR, 'ExcelRobotTest.xls'))
+    assert library.reader is None
+    library.close_all_excel()
+
+
+def test_read_excel_files():
+    library = ExcelLibrary()
+    files = library.read_excel_files(path.join(DATA_DIR, 'ExcelRobotTest.*'), False, workers=2)
+    assert [path.basename(file_path) for file_path in files] == ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx']
+    for file_path, values in files.items():
+        library.open_excel(file_path)
+        assert values == library.get_workbook_values(False)
+    assert library.read_excel_files(path.join(DATA_DIR, '*.txt')) == {}
+
+
+@pytest.mark.parametrize('ext', ['xls', 'xlsx'])
+def test_read_keywords_on_writer_for_reading(tmp_path, ext):
+    library = ExcelLibrary()
+    library.open_excel(path.join(DATA_DIR, 'ExcelRobotTest.' + ext), alias='other')
+    library.open_excel_to_write(path.join(DATA_DIR, 'ExcelRobotTest.' + ext), path.join(tmp_path, 'out.' + ext),
+                                use_for_reading=True)
+    library.write_to_cell_by_name('TestSheet1', 'A2', 'User9')
+    library.create_sheet('Written')
+    library.write_range('Written', 'A1', [['Name', 'Points']])
+    library.write_range('Written', 'A2', [['User9', 12]], 'TEXT,NUMBER')
+    assert library.get_sheet_names()[-1] == 'Written'
+    assert library.get_number_of_sheets() == 6
+    assert library.get_column_count('Written') == 2
+    assert library.get_row_count('Written') == 2
+    assert library.get_column_values('Written', 0) == [('A1', 'Name'), ('A2', 'User9')]
+    assert library.get_row_values('Written', 1) == [('A2', 'User9'), ('B2', 12)]
+    assert library.get_sheet_values('Written') == [('A1', 'Name'), ('A2', 'User9'), ('B1', 'Points'), ('B2', 12)]
+    assert library.get_sheet_values_as_table('Written', 0) == [{'Name': 'User9', 'Points': 12}]
+    assert library.get_row_values_as_table('Written', 1) == [['User9', 12]]
+    assert library.get_column_values_as_table('Written', '0,1', 0) == [{'Name': 'User9', 'Points': 12}]
+    assert library.get_workbook_values()[-1] == ['Written', ('A1', 'Name'), ('A2', 'User9'), ('B1', 'Points'),
+                                                 ('B2', 12)]
+    assert library.read_cell_data_by_name('TestSheet1', 'A2') == 'User9'
+    assert library.read_cell_data('Written', 1, 1) == '12.00'
+    assert library.read_range('Written', 'A1:B2') == [['Name', 'Points'], ['User9', '12.00']]
+    cursor = library.open_row_cursor('Written', 1)
+    assert library.fetch_rows(cursor, 5) == [['User9', '12.00']]
+    library.close_row_cursor(cursor)
+    assert library.find_row_by_value('Written', 0, 'User9') == 1
+    assert library.find_rows_by_values('Written', '0,1', 'User9,12') == [1]
+    assert library.find_cells_matching('User9') == ['TestSheet1!A2', 'Written!A2']
+    assert library.check_cell_type('Written', 1, 1, 'NUMBER')
+    csv_path = path.join(tmp_path, 'written.csv')
+    assert library.export_sheet_to_csv('Written', csv_path) == 2
+    with open(csv_path) as handle:
+        assert handle.read().splitlines() == ['Name,Points', 'User9,12.00']
+    jsonl_path = path.join(tmp_path, 'written.jsonl')
+    assert library.export_sheet_to_jsonl('Written', jsonl_path, header_row=0) == 1
+    with open(jsonl_path) as handle:
+        assert json.loads(handle.readline()) == {'Name': 'User9', 'Points': '12.00'}
+    summary = library.compare_excel_sheets('TestSheet1', 'other')
+    assert not summary['equal']
+    assert summary['equal_rows'] == 2
+    library.close_all_excel()
@@ -0,0 +1,70 @@
+#!/usr/bin/python
+import json
+import os.path as path
+
+import pytest
+
+from ExcelRobot.listener import ExcelMetricsListener
+from ExcelRobot.metrics import METRICS
+from ExcelRobot.reader import ExcelReader
+from ExcelRobot.writer import ExcelWriter
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+
+
+@pytest.fixture
+def metrics():
+    METRICS.reset()
+    METRICS.enabled = True
+    yield METRICS
+    METRICS.enabled = False
+    METRICS.reset()
+
+
+def test_disabled_metrics():
+    METRICS.reset()
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'))
+    reader.read_range('TestSheet1', 'A1:B3')
+    assert METRICS.snapshot()['counters'] == {}
+    assert METRICS.snapshot()['timers'] == {}
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_reader_and_writer_metrics(metrics, tmp_path, input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    reader.read_range('TestSheet1', 'A1:B3')
+    reader.read_cell_data('TestSheet1', 1, 1)
+    reader.get_sheet_values_as_table('DataSheet')
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), path.join(tmp_path, 'metrics_' + input_file))
+    writer.write_to_cell('TestSheet1', 0, 5, 'User9')
+    writer.write_rows('TestSheet1', 0, 6, [['User10', 1], ['User11', None]])
+    writer.save_excel()
+    snapshot = metrics.snapshot()
+    assert snapshot['counters']['cells_read'] == 6 + 1 + 16
+    assert snapshot['counters']['cells_written'] == 4
+    assert snapshot['counters']['bytes_saved'] == path.getsize(path.join(tmp_path, 'metrics_' + input_file))
+    assert snapshot['timers']['convert']['count'] == 1 + 1 + 2
+    assert snapshot['timers']['save']['count'] == 1
+
+
+def test_listener_summarizes_suites(metrics, tmp_path):
+    output = path.join(tmp_path, 'metrics.json')
+    listener = ExcelMetricsListener(output)
+    listener.start_suite('Root', {'longname': 'Root'})
+    listener.start_suite('Child', {'longname': 'Root.Child'})
+    ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls')).read_cell_data('TestSheet1', 1, 1)
+    listener.end_keyword('ExcelRobot.Read Cell Data', {'libname': 'ExcelRobot', 'kwname': 'Read Cell Data',
+                                                       'elapsedtime': 20})
+    listener.end_keyword('BuiltIn.Log', {'libname': 'BuiltIn', 'kwname': 'Log', 'elapsedtime': 5})
+    listener.end_suite('Child', {'longname': 'Root.Child'})
+    listener.end_keyword('ExcelRobot.Open Excel', {'libname': 'ExcelRobot', 'kwname': 'Open Excel',
+                                                   'elapsedtime': 50})
+    listener.end_suite('Root', {'longname': 'Root'})
+    listener.close()
+    suites = metrics.snapshot()['suites']
+    assert suites['Root.Child']['keywords'] == {'Read Cell Data': {'count': 1, 'seconds': 0.02}}
+    assert suites['Root.Child']['counters'] == {'cells_read': 1}
+    assert list(suites['Root']['keywords']) == ['Open Excel', 'Read Cell Data']
+    with open(output) as handle:
+        assert json.load(handle)['keywords']['Open Excel']['count'] == 1
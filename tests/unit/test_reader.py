@@ -28,6 +28,30 @@ def test_open_success(input_file, expected):
     assert reader.get_number_of_sheets() == expected
 
 
+@pytest.mark.parametrize('input_file,mode', [
+    ('ExcelRobotTest.xls', 'default'), ('ExcelRobotTest.xlsx', 'default'), ('ExcelRobotTest.xlsx', 'streaming')])
+def test_open_from_bytes(input_file, mode):
+    file_path = path.join(DATA_DIR, input_file)
+    with open(file_path, 'rb') as handle:
+        reader = ExcelReader(None, mode=mode, file_contents=handle.read())
+    expected = ExcelReader(file_path, mode=mode)
+    assert reader.extension == expected.extension
+    assert reader.get_sheet_values_as_table('TestSheet3') == expected.get_sheet_values_as_table('TestSheet3')
+    assert reader.get_workbook_values(workers=2) == expected.get_workbook_values()
+
+
+def test_open_from_invalid_bytes():
+    with pytest.raises(ValueError):
+        ExcelReader(None, file_contents=b'')
+    with pytest.raises(ValueError):
+        ExcelReader(None, file_contents='PK')
+
+
+def test_open_without_mmap():
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'), use_mmap=False)
+    assert reader.read_cell_data('TestSheet1', 0, 1) == 'User1'
+
+
 @pytest.mark.parametrize(
     'input_file,expected',
     [('ExcelRobotTest.xls', 'TestSheet1'), ('ExcelRobotTest.xlsx', 'TestSheet1')],
@@ -78,6 +102,19 @@ def test_get_row_values(input_file, sheet_name, column, expected):
     assert reader.get_row_values(sheet_name, column) == expected
 
 
+@pytest.mark.parametrize('input_file,mode', [
+    ('ExcelRobotTest.xls', 'default'), ('ExcelRobotTest.xlsx', 'default'), ('ExcelRobotTest.xlsx', 'streaming')])
+def test_get_values_without_empty_cells(input_file, mode):
+    reader = ExcelReader(path.join(DATA_DIR, input_file), mode=mode)
+    values = reader.get_sheet_values('TestSheet3', False)
+    assert values == [(name, value) for name, value in reader.get_sheet_values('TestSheet3') if value]
+    assert ('E3', '  ') in values and ('D2', 1) in values
+    assert not [name for name, _ in values if name in ('D3', 'E2', 'F2', 'I3')]
+    assert reader.get_row_values('TestSheet3', 2, False) == [
+        (name, value) for name, value in reader.get_row_values('TestSheet3', 2) if value]
+    assert reader.get_column_values('TestSheet3', 8, False) == [('I1', 'Date Time'), ('I2', 43102.916666666664)]
+
+
 @pytest.mark.parametrize(
     'input_file, sheet_name, cell_name, expected',
     [
@@ -160,3 +197,117 @@ def test_get_cell_raw_value_by_coord(input_file, sheet_name, col, row, expected)
 def test_check_cell_type(input_file, sheet_name, col, row, data_type, expected):
     reader = ExcelReader(path.join(DATA_DIR, input_file))
     assert reader.check_cell_type(sheet_name, col, row, data_type) == expected
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_get_sheet_values_as_table(input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    assert reader.get_sheet_values_as_table('TestSheet1') == [
+        ['This is a test sheet', 'Points'],
+        ['User1', 57],
+        ['User2', 5178],
+    ]
+    assert reader.get_sheet_values_as_table('TestSheet1', header_row=0) == [
+        {'This is a test sheet': 'User1', 'Points': 57},
+        {'This is a test sheet': 'User2', 'Points': 5178},
+    ]
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_get_row_values_as_table(input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    assert reader.get_row_values_as_table('TestSheet1', 1) == [['User1', 57], ['User2', 5178]]
+    assert reader.get_row_values_as_table('TestSheet1', '1', '1') == [['User1', 57]]
+    assert reader.get_row_values_as_table('TestSheet1', 0, header_row=0) == [
+        {'This is a test sheet': 'User1', 'Points': 57},
+        {'This is a test sheet': 'User2', 'Points': 5178},
+    ]
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_get_column_values_as_table(input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    assert reader.get_column_values_as_table('TestSheet1', '1,0') == [
+        ['Points', 'This is a test sheet'],
+        [57, 'User1'],
+        [5178, 'User2'],
+    ]
+    assert reader.get_column_values_as_table('TestSheet1', [1], header_row=0) == [{'Points': 57}, {'Points': 5178}]
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_read_range(input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    assert reader.read_range('TestSheet1', 'A2:B3') == [['User1', '57.00'], ['User2', '5,178.00']]
+    assert reader.read_range('TestSheet1', 'B:B', use_format=False) == [['Points'], [57], [5178]]
+    assert reader.read_range(None, 'TestSheet3!C2:D3') == [['1982-05-14', 'Yes'], ['1978-04-13', 'No']]
+    assert reader.read_range('TestSheet3', 'C2:C3', DataType.DATE.name, False) == [
+        [datetime(1982, 5, 14).date()],
+        [datetime(1978, 4, 13).date()],
+    ]
+    with pytest.raises(ValueError):
+        reader.read_range('TestSheet3', 'C2:C3', DataType.NUMBER.name)
+
+
+@pytest.mark.parametrize('input_file,mode', [
+    ('ExcelRobotTest.xls', 'default'), ('ExcelRobotTest.xlsx', 'default'), ('ExcelRobotTest.xlsx', 'streaming')])
+def test_find_cells_matching(input_file, mode):
+    reader = ExcelReader(path.join(DATA_DIR, input_file), mode=mode)
+    assert reader.find_cells_matching('User1') == ['TestSheet1!A2']
+    assert reader.find_cells_matching('user', 'ignore_case', max_matches=3) == [
+        'TestSheet1!A2', 'TestSheet1!A3', 'TestSheet2!A2']
+    assert reader.find_cells_matching(r'^User\d$', 'regex', sheet_name='TestSheet3') == [
+        'TestSheet3!B2', 'TestSheet3!B3']
+    assert reader.find_cells_matching('Team', range_name='DataSheet!A3:B4') == ['DataSheet!A3', 'DataSheet!A4']
+    assert reader.find_cells_matching('User', sheet_name='TestSheet1', range_name='B:B') == []
+
+
+@pytest.mark.parametrize('input_file,mode', [
+    ('ExcelRobotTest.xls', 'default'), ('ExcelRobotTest.xlsx', 'default'), ('ExcelRobotTest.xlsx', 'streaming')])
+def test_row_cursor(input_file, mode):
+    reader = ExcelReader(path.join(DATA_DIR, input_file), mode=mode)
+    cursor = reader.open_row_cursor('TestSheet1')
+    other = reader.open_row_cursor('TestSheet1', start_row=1, use_format=False)
+    assert reader.fetch_rows(cursor, 2) == [['This is a test sheet', 'Points'], ['User1', '57.00']]
+    assert reader.fetch_rows(other, 5) == [['User1', 57], ['User2', 5178]]
+    assert reader.fetch_rows(cursor, 2) == [['User2', '5,178.00']]
+    assert reader.fetch_rows(cursor) == []
+    assert reader.close_row_cursor(cursor) == 3
+    with pytest.raises(ValueError):
+        reader.fetch_rows(cursor)
+    with pytest.raises(ValueError):
+        reader.fetch_rows(other, 0)
+    reader.close()
+    with pytest.raises(ValueError):
+        reader.fetch_rows(other)
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_find_rows_by_values(input_file):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    assert reader.find_row_by_value('TestSheet1', 0, 'User2') == 2
+    assert reader.find_row_by_value('TestSheet1', '1', '57') == 1
+    assert reader.find_row_by_value('TestSheet1', 1, 58) is None
+    assert reader.find_rows_by_values('TestSheet1', '0,1', 'User2,5178') == [2]
+    assert reader.find_rows_by_values('TestSheet1', [0, 1], ['User2', 57]) == []
+    assert ('TestSheet1', (0,)) in reader._indexes
+    with pytest.raises(ValueError):
+        reader.find_rows_by_values('TestSheet1', [0, 1], ['User2'])
+
+
+def test_xls_workbook_values_in_processes():
+    reader = ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'))
+    assert reader.get_workbook_values(False, workers=2) == reader.get_workbook_values(False)
+
+
+@pytest.mark.parametrize('input_file,in_processes', [('ExcelRobotTest.xls', True), ('ExcelRobotTest.xlsx', False)])
+def test_workbook_values_in_processes_only_for_xls(monkeypatch, input_file, in_processes):
+    reader = ExcelReader(path.join(DATA_DIR, input_file))
+    tasks = []
+
+    def map_in_processes(func, items, workers):
+        tasks.extend(items)
+        return [func(item) for item in items]
+    monkeypatch.setattr('ExcelRobot.reader.map_in_processes', map_in_processes)
+    assert reader.get_workbook_values(False, workers=2) == reader.get_workbook_values(False)
+    assert bool(tasks) == in_processes
@@ -0,0 +1,48 @@
+#!/usr/bin/python
+
+import pytest
+
+from ExcelRobot.reference import CellRange, parse_cell, parse_range
+from ExcelRobot.utils import excel_name2coord
+
+
+@pytest.mark.parametrize(
+    'cell_name,expected',
+    [('A1', (0, 0)), ('a2', (0, 1)), ('$B$3', (1, 2)), ('Z10', (25, 9)), ('AA1', (26, 0)), ('XFD1048576', (16383, 1048575))],
+)
+def test_parse_cell(cell_name, expected):
+    assert parse_cell(cell_name) == expected
+    assert excel_name2coord(cell_name) == expected
+
+
+@pytest.mark.parametrize('cell_name', ['', 'A', '1', 'A0', '1A', 'A1B', 'A1:B2', 'ABCD1'])
+def test_parse_cell_invalid(cell_name):
+    with pytest.raises(ValueError):
+        parse_cell(cell_name)
+
+
+@pytest.mark.parametrize(
+    'reference,expected',
+    [
+        ('A1:D100', CellRange(None, 0, 0, 3, 99)),
+        ('D100:A1', CellRange(None, 0, 0, 3, 99)),
+        ('C5', CellRange(None, 2, 4, 2, 4)),
+        ('B:B', CellRange(None, 1, None, 1, None)),
+        ('3:3', CellRange(None, None, 2, None, 2)),
+        ('Sheet1!A1:C9', CellRange('Sheet1', 0, 0, 2, 8)),
+        ("'Graph Data'!$A$1:$B$2", CellRange('Graph Data', 0, 0, 1, 1)),
+    ],
+)
+def test_parse_range(reference, expected):
+    assert parse_range(reference) == expected
+
+
+@pytest.mark.parametrize('reference', ['A1:B2:C3', 'A:3', 'B', '3', 'A1:B'])
+def test_parse_range_invalid(reference):
+    with pytest.raises(ValueError):
+        parse_range(reference)
+
+
+def test_resolve_range():
+    assert parse_range('B:C').resolve(10, 5) == (1, 0, 2, 9)
+    assert parse_range('A2:Z100').resolve(10, 5) == (0, 1, 4, 9)
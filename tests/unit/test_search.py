@@ -0,0 +1,44 @@
+#!/usr/bin/python
+import pytest
+
+from ExcelRobot.reference import cell_reference, parse_range
+from ExcelRobot.search import compile_matcher, find_cells
+from xlrd import XL_CELL_NUMBER, XL_CELL_TEXT
+
+
+@pytest.mark.parametrize('pattern,mode,text,expected', [
+    ('User', 'literal', 'User1', True),
+    ('user', 'literal', 'User1', False),
+    ('user', 'ignore_case', 'USER1', True),
+    (r'^User\d$', 'regex', 'User1', True),
+    (r'^User\d$', 'regex', 'User10', False),
+    ('1.5', 'literal', '1x5', False),
+])
+def test_compile_matcher(pattern, mode, text, expected):
+    assert compile_matcher(pattern, mode)(text) == expected
+
+
+def test_compile_matcher_invalid_mode():
+    with pytest.raises(ValueError):
+        compile_matcher('User', 'fuzzy')
+
+
+def test_find_cells_tests_each_text_once():
+    tested = []
+
+    def matcher(text):
+        tested.append(text)
+        return text.startswith('a')
+
+    rows = [('Sheet1', rowx, 1, [XL_CELL_TEXT, XL_CELL_TEXT, XL_CELL_NUMBER], ['a', 'b', 1.0]) for rowx in range(3)]
+    assert find_cells(iter(rows), matcher) == ['Sheet1!B1', 'Sheet1!B2', 'Sheet1!B3']
+    assert tested == ['a', 'b']
+    assert find_cells(iter(rows), matcher, max_matches=2) == ['Sheet1!B1', 'Sheet1!B2']
+
+
+@pytest.mark.parametrize('sheet_name,expected', [
+    ('Sheet1', 'Sheet1!C2'), ('Graph Data', "'Graph Data'!C2"), ("Bob's", "'Bob''s'!C2"), ('2019', "'2019'!C2")])
+def test_cell_reference(sheet_name, expected):
+    reference = cell_reference(sheet_name, 1, 2)
+    assert reference == expected
+    assert parse_range(reference).sheet_name == sheet_name
@@ -0,0 +1,68 @@
+#!/usr/bin/python
+import os.path as path
+import re
+import zipfile
+
+import openpyxl
+import pytest
+
+from ExcelRobot.reader import ExcelReader
+
+CURRENT_DIR = path.dirname(path.abspath(__file__))
+DATA_DIR = path.join(CURRENT_DIR, '../data')
+XLSX_FILE = path.join(DATA_DIR, 'ExcelRobotTest.xlsx')
+
+
+def test_streaming_mode_not_support_xls():
+    with pytest.raises(ValueError):
+        ExcelReader(path.join(DATA_DIR, 'ExcelRobotTest.xls'), mode='streaming')
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        ExcelReader(XLSX_FILE, mode='lazy')
+
+
+@pytest.mark.parametrize('sheet_name', ['TestSheet1', 'TestSheet2', 'TestSheet3', 'DataSheet'])
+def test_streaming_reads_same_values(sheet_name):
+    reader = ExcelReader(XLSX_FILE)
+    streaming = ExcelReader(XLSX_FILE, mode='streaming')
+    assert streaming.get_sheet_names() == reader.get_sheet_names()
+    assert streaming.get_row_count(sheet_name) == reader.get_row_count(sheet_name)
+    assert streaming.get_column_count(sheet_name) == reader.get_column_count(sheet_name)
+    assert streaming.get_sheet_values(sheet_name) == reader.get_sheet_values(sheet_name)
+    assert streaming.get_sheet_values_as_table(sheet_name) == reader.get_sheet_values_as_table(sheet_name)
+    assert streaming.get_column_values(sheet_name, 1, False) == reader.get_column_values(sheet_name, 1, False)
+
+
+def test_streaming_rows_backward():
+    streaming = ExcelReader(XLSX_FILE, mode='streaming')
+    assert streaming.get_row_values('TestSheet1', 2) == [('A3', 'User2'), ('B3', 5178)]
+    assert streaming.get_row_values('TestSheet1', 1) == [('A2', 'User1'), ('B2', 57)]
+
+
+def test_streaming_random_access_not_supported():
+    streaming = ExcelReader(XLSX_FILE, mode='streaming')
+    with pytest.raises(ValueError):
+        streaming.read_cell_data('TestSheet1', 0, 1)
+
+
+def test_streaming_ignores_stale_dimension(tmp_path):
+    source = path.join(tmp_path, 'source.xlsx')
+    workbook = openpyxl.Workbook()
+    for index in range(50):
+        workbook.active.append(['User' + str(index), index, 'x' if index == 30 else None])
+    workbook.save(source)
+    stale = path.join(tmp_path, 'stale.xlsx')
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(stale, 'w') as dest:
+        for item in src.infolist():
+            content = src.read(item.filename)
+            if item.filename == 'xl/worksheets/sheet1.xml':
+                content, replaced = re.subn(b'<dimension ref="[^"]*"', b'<dimension ref="A1:B1"', content)
+                assert replaced == 1
+            dest.writestr(item, content)
+    reader = ExcelReader(stale)
+    streaming = ExcelReader(stale, mode='streaming')
+    assert streaming.get_row_count('Sheet') == reader.get_row_count('Sheet') == 50
+    assert streaming.get_column_count('Sheet') == reader.get_column_count('Sheet') == 3
+    assert streaming.get_sheet_values('Sheet') == reader.get_sheet_values('Sheet')
@@ -1,17 +1,20 @@
 #!/usr/bin/python
 
+import filecmp
 import os
 import os.path as path
 import shutil
+import stat
 import tempfile
 from datetime import date, datetime, time
 
 import pytest
 from six import PY2
 
+from ExcelRobot.books import OpenpyxlBook
 from ExcelRobot.reader import ExcelReader
 from ExcelRobot.utils import DataType, copy_file, random_name
-from ExcelRobot.writer import ExcelWriter
+from ExcelRobot.writer import ExcelWriter, import_csv
 
 CURRENT_DIR = path.dirname(path.abspath(__file__))
 DATA_DIR = path.join(CURRENT_DIR, '../data')
@@ -144,3 +147,162 @@ def test_write_format_value_in_new_sheet(input_file, sheet_name, data):
         reader.read_cell_data(sheet_name, data['column'], data['row'], data_type=data['type'], use_format=True)
         == data['value']
     )
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_write_range(input_file):
+    new_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), new_file)
+    writer.create_sheet('TestSheet40')
+    writer.write_range('TestSheet40', 'A2', [['Id', 'Name', 'Born']])
+    writer.write_range('TestSheet40', 'B3', [['User1', '2018-01-01'], ['User2', None]], 'TEXT,DATE')
+    writer.write_rows('TestSheet40', 0, 2, [[25.5], ['26']], DataType.NUMBER.name)
+    writer.save_excel()
+    reader = ExcelReader(new_file)
+    assert reader.get_sheet_values_as_table('TestSheet40', header_row=1) == [
+        {'Id': 25.5, 'Name': 'User1', 'Born': 43101.0},
+        {'Id': 26.0, 'Name': 'User2', 'Born': ''},
+    ]
+    assert reader.read_cell_data_by_name('TestSheet40', 'C3') == '2018-01-01'
+    assert reader.read_cell_data_by_name('TestSheet40', 'A4') == '26.00'
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_append_rows(input_file):
+    new_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), new_file)
+    writer.create_sheet('TestSheet41')
+    writer.append_rows('TestSheet41', [['User1', 57]])
+    writer.append_rows('TestSheet1', [['User3', 8], ['User4', True]])
+    writer.append_rows('TestSheet41', [['User2', 5178]])
+    writer.save_excel()
+    reader = ExcelReader(new_file)
+    assert reader.get_sheet_values_as_table('TestSheet41') == [['User1', 57], ['User2', 5178]]
+    assert reader.get_row_values_as_table('TestSheet1', 3) == [['User3', 8], ['User4', 1]]
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_style_registry(input_file):
+    new_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), new_file)
+    writer.create_sheet('TestSheet50')
+    writer.write_rows('TestSheet50', 0, 0, [[1, 2.5], [date(2018, 1, 1), 3]])
+    writer.write_to_cell('TestSheet50', 0, 2, 4)
+    if writer.is_xls:
+        assert writer.get_style_stats() == {'styles': 2, 'hits': 3}
+    else:
+        with pytest.raises(ValueError):
+            writer.get_style_stats()
+    writer.save_excel()
+    assert ExcelReader(new_file).read_cell_data('TestSheet50', 0, 1) == '2018-01-01'
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_save_in_place_with_backup(input_file):
+    test_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    copy_file(path.join(DATA_DIR, input_file), test_file, True)
+    writer = ExcelWriter(test_file)
+    writer.create_sheet('TestSheet60')
+    writer.save_excel(fsync=True, backup=True)
+    assert 'TestSheet60' in ExcelReader(test_file).get_sheet_names()
+    assert filecmp.cmp(path.join(DATA_DIR, input_file), test_file + '.bak', shallow=False)
+    leftovers = [name for name in os.listdir(TEMP_DIR) if name.startswith('.' + path.basename(test_file))]
+    assert leftovers == []
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File mode is not supported on Windows')
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_save_keeps_file_mode(input_file):
+    test_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    copy_file(path.join(DATA_DIR, input_file), test_file, True)
+    os.chmod(test_file, 0o640)
+    writer = ExcelWriter(test_file)
+    writer.create_sheet('TestSheet61')
+    writer.save_excel()
+    assert stat.S_IMODE(os.stat(test_file).st_mode) == 0o640
+    new_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    ExcelWriter(path.join(DATA_DIR, input_file), new_file).save_excel()
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(new_file).st_mode) == 0o666 & ~umask
+
+
+def test_xlsx_writer_reads_from_openpyxl_model():
+    input_file = path.join(DATA_DIR, 'ExcelRobotTest.xlsx')
+    new_file = path.join(TEMP_DIR, random_name() + '_ExcelRobotTest.xlsx')
+    writer = ExcelWriter(input_file, new_file)
+    reader = ExcelReader(input_file)
+    assert isinstance(writer.workbook, OpenpyxlBook)
+    for sheet_name in ['TestSheet1', 'TestSheet2', 'TestSheet3']:
+        assert writer.get_sheet_values(sheet_name) == reader.get_sheet_values(sheet_name)
+        for col in range(reader.get_column_count(sheet_name)):
+            assert writer.read_cell_data(sheet_name, col, 1) == reader.read_cell_data(sheet_name, col, 1)
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_read_your_writes(input_file):
+    new_file = path.join(TEMP_DIR, random_name() + '_' + input_file)
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), new_file)
+    assert writer.find_row_by_value('TestSheet1', 0, 'User3') is None
+    writer.write_to_cell_by_name('TestSheet1', 'A2', 'User3')
+    writer.write_to_cell('TestSheet1', 2, 3, '2018-01-01', DataType.DATE.name)
+    writer.create_sheet('TestSheet70')
+    writer.write_rows('TestSheet70', 0, 0, [['Name', 25.5]])
+    assert writer.find_row_by_value('TestSheet1', 0, 'User3') == 1
+    assert writer.read_cell_data('TestSheet1', 2, 3) == '2018-01-01'
+    assert writer.get_row_count('TestSheet1') == 4
+    assert writer.get_column_count('TestSheet1') == 3
+    assert writer.get_row_values('TestSheet1', 1) == [('A2', 'User3'), ('B2', 57), ('C2', '')]
+    assert writer.get_sheet_values_as_table('TestSheet70') == [['Name', 25.5]]
+    assert 'TestSheet70' in writer.get_sheet_names()
+
+
+@pytest.mark.parametrize('input_file', ['ExcelRobotTest.xls', 'ExcelRobotTest.xlsx'])
+def test_read_range_from_writer(input_file):
+    writer = ExcelWriter(path.join(DATA_DIR, input_file), path.join(TEMP_DIR, random_name() + '_' + input_file))
+    assert writer.read_range('TestSheet1', 'A2:B3') == [['User1', '57.00'], ['User2', '5,178.00']]
+    writer.write_rows('TestSheet1', 0, 3, [['User3', 8]], 'TEXT,NUMBER')
+    assert writer.read_range('TestSheet1', 'A3:B4', use_format=False) == [['User2', 5178], ['User3', 8]]
+
+
+@pytest.mark.parametrize('input_file', ['new.xls', 'new.xlsx'])
+def test_read_your_writes_in_new_file(input_file):
+    writer = ExcelWriter(path.join(TEMP_DIR, random_name() + '_' + input_file))
+    writer.write_to_cell('Sheet', 1, 0, 34)
+    assert writer.read_cell_data('Sheet', 1, 0) == '34.00'
+    assert writer.get_sheet_values('Sheet') == [('A1', ''), ('B1', 34)]
+
+
+@pytest.mark.parametrize('ext', ['xls', 'xlsx'])
+def test_import_csv(ext):
+    csv_path = path.join(TEMP_DIR, random_name() + '.csv')
+    with open(csv_path, 'w') as handle:
+        handle.write('Name;Points;Birthday\nUser1;57;1982-05-14\nUser2;;1978-04-13\n')
+    file_path = path.join(TEMP_DIR, random_name() + '.' + ext)
+    assert import_csv(csv_path, file_path, 'Users', 'TEXT,NUMBER,DATE', ';', header=True) == 3
+    reader = ExcelReader(file_path)
+    assert reader.get_sheet_names() == ['Users']
+    assert reader.read_cell_data_by_name('Users', 'B1') == 'Points'
+    assert reader.read_cell_data_by_name('Users', 'B2', use_format=False) == 57
+    assert reader.read_cell_data_by_name('Users', 'C3', use_format=False) == datetime(1978, 4, 13)
+    assert reader.check_cell_type('Users', 1, 2, 'EMPTY')
+    with pytest.raises(IOError if PY2 else FileExistsError):
+        import_csv(csv_path, file_path)
+    assert import_csv(csv_path, file_path, delimiter=';', override=True) == 3
+    assert ExcelReader(file_path).read_cell_data_by_name('Sheet1', 'B2') == '57'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='File mode is not supported on Windows')
+@pytest.mark.parametrize('ext', ['xls', 'xlsx'])
+def test_import_csv_keeps_file_mode(ext):
+    csv_path = path.join(TEMP_DIR, random_name() + '.csv')
+    with open(csv_path, 'w') as handle:
+        handle.write('User1,57\n')
+    file_path = path.join(TEMP_DIR, random_name() + '.' + ext)
+    import_csv(csv_path, file_path)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o666 & ~umask
+    os.chmod(file_path, 0o640)
+    import_csv(csv_path, file_path, override=True)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640